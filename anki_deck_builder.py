@@ -16,19 +16,25 @@ Requires: pip install typer[all] rich requests genanki unidecode python-slugify
 from __future__ import annotations
 
 import csv
+import functools
 import importlib
 import hashlib
+import itertools
 import json
+import logging
 import os
 import random
 import re
 import sys
 import tempfile
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 from urllib.parse import quote
 
 try:
@@ -36,10 +42,15 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - handled gracefully for optional deps
     requests = None  # type: ignore
 
+# gTTS is only needed once audio is synthesized; _require_gtts imports it on
+# first use so CLI start-up and --help don't pay for it.
+gtts_spec = importlib.util.find_spec("gtts")
+gTTS: Any = None
+
 try:
-    from gtts import gTTS  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - handled gracefully for optional deps
-    gTTS = None  # type: ignore
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib json is used instead
+    orjson = None  # type: ignore
 
 typer_spec = importlib.util.find_spec("typer")
 if typer_spec is not None:
@@ -135,8 +146,10 @@ slugify_spec = importlib.util.find_spec("slugify")
 if slugify_spec is not None:
     from slugify import slugify
 else:  # pragma: no cover - exercised when python-slugify is not installed
+    _SLUGIFY_FALLBACK_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
     def slugify(value: str) -> str:
-        return re.sub(r"[^A-Za-z0-9_-]+", "_", value).strip("_")
+        return _SLUGIFY_FALLBACK_RE.sub("_", value).strip("_")
 
 
 genanki_spec = importlib.util.find_spec("genanki")
@@ -174,15 +187,11 @@ else:  # pragma: no cover - exercised when genanki is not installed
 
     genanki = _DummyGenankiModule()
 
-
-unidecode_spec = importlib.util.find_spec("unidecode")
-if unidecode_spec is not None:
-    from unidecode import unidecode
-else:  # pragma: no cover - exercised when unidecode is not installed
-    def unidecode(value: str) -> str:
-        return value
-
+from circuit_breaker import HostCircuitBreaker
+from http_cache import CachedResponse, ResponseCache
+from jisho_schema import JishoEntry, decode_jisho_response, jisho_response_from_json
 from kotobank_dictionary import extract_first_kotobank_definition
+from rate_limit import HostConcurrencyLimiter, HostRateLimiter
 from wikipedia_utils import clean_wikipedia_extract
 from wiktionary_parser import extract_first_japanese_definition
 
@@ -203,6 +212,16 @@ WIKIPEDIA_JA_API = "https://ja.wikipedia.org/w/api.php"
 WIKTIONARY_JA_API = "https://ja.wiktionary.org/w/api.php"
 DUCKDUCKGO_BASE = "https://duckduckgo.com/"
 
+_CSV_DELIMITER_RE = re.compile(r"[;,\t]")
+_ENGLISH_GLOSS_SPLIT_RE = re.compile(r"[;,/]|\band\b", re.IGNORECASE)
+# Deletes every ASCII character outside a-z; non-ASCII is dropped by encoding first.
+_NON_ALPHA_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not "a" <= chr(c) <= "z")
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+_VQD_RE = re.compile(r"vqd=['\"]?([\w-]+)['\"]?")
+_SLUG_RE = re.compile(r"[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*")
+
 _jp_tokenizer_initialized = False
 _jp_tokenizer: Optional[Any] = None
 
@@ -210,12 +229,61 @@ DEFAULT_MODEL_NAME = "JP Word w/ Image + Examples (MVP)"
 DEFAULT_GRAMMAR_MODEL_NAME = "JP Grammar Concept (MVP)"
 DEFAULT_DECK_NAME = "Japanese Auto Deck"
 CONFIG_FILE = "anki_deck_builder.config.json"
+HTTP_CACHE_FILE = "anki_deck_builder.http_cache.sqlite"
+DEBUG_LOG_FILE = "anki_deck_builder_debug_log.txt"
 MEDIA_DIR_NAME = "media"
+# Terms are enriched concurrently; each worker issues its own API calls, so keep
+# this modest to stay within the public APIs' rate limits.
+DEFAULT_FETCH_WORKERS = 8
+# Image bodies are read in chunks this size and counted against MAX_IMAGE_BYTES,
+# so an oversized body is dropped after at most one chunk past the limit.
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Cards show images at half width; anything larger than this is not a thumbnail
+# and would only bloat the .apkg, so the next search result is tried instead.
+MAX_IMAGE_BYTES = 512 * 1024
+# Requests per second allowed to each API host. Other hosts (image CDNs) use
+# DEFAULT_HOST_RATE. Kotobank is scraped HTML, so it gets the gentlest pace.
+HOST_RATE_LIMITS = {
+    "jisho.org": 8.0,
+    "tatoeba.org": 4.0,
+    "kotobank.jp": 2.0,
+    "ja.wikipedia.org": 8.0,
+    "ja.wiktionary.org": 8.0,
+    "duckduckgo.com": 4.0,
+}
+DEFAULT_HOST_RATE = 8.0
+# In-flight request caps per host, on top of the request rates above.
+HOST_CONCURRENCY_LIMITS = {
+    "jisho.org": 8,
+    "tatoeba.org": 4,
+    "kotobank.jp": 2,
+    "ja.wikipedia.org": 4,
+    "ja.wiktionary.org": 4,
+    "duckduckgo.com": 4,
+}
+DEFAULT_HOST_CONCURRENCY = 8
+DUCKDUCKGO_MAX_DOWNLOAD_ATTEMPTS = 3
+# MediaWiki returns at most 20 intro extracts per query (exlimit).
+WIKIPEDIA_BATCH_SIZE = 20
+# Plain title lookups (no extracts) accept up to 50 titles per query.
+WIKTIONARY_BATCH_SIZE = 50
+# After this many consecutive timeouts/connection errors/5xx responses from one
+# host, its requests fail fast for the cooldown instead of each waiting on retries.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 300.0
+MAX_RETRY_AFTER_SECONDS = 10.0
+# With --lean-definitions, terms whose Jisho entry has this many senses skip the
+# Wiktionary/Kotobank lookups when Wikipedia has nothing.
+RICH_GLOSS_MIN_SENSES = 2
+PROGRESS_REFRESH_PER_SECOND = 4
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep per-instance dicts.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # -----------------------------
 # Data structures
 # -----------------------------
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CardData:
     term: str
     reading: str = ""
@@ -229,25 +297,20 @@ class CardData:
 
     def to_fields(self) -> List[str]:
         # Order must match the model fields list below
-        img_tag = f'<img src="{self.image_filename}" />' if self.image_filename else ''
-        audio_tag = f"[sound:{self.audio_filename}]" if self.audio_filename else ""
-        sentence_audio_tag = (
-            f"[sound:{self.sentence_audio_filename}]" if self.sentence_audio_filename else ""
-        )
         return [
             self.term,
             self.reading,
             self.english,
             self.sentence_jp,
             self.sentence_en,
-            sentence_audio_tag,
+            f"[sound:{self.sentence_audio_filename}]" if self.sentence_audio_filename else "",
             self.definition_ja,
-            audio_tag,
-            f"<div>{img_tag}</div>",
+            f"[sound:{self.audio_filename}]" if self.audio_filename else "",
+            f'<div><img src="{self.image_filename}" /></div>' if self.image_filename else "<div></div>",
         ]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GrammarCardData:
     question: str
     explanation: str = ""
@@ -286,7 +349,7 @@ class InputMode(str, Enum):
     GRAMMAR = "grammar"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BuildParams:
     csv_path: Path
     output_dir: Path
@@ -295,9 +358,12 @@ class BuildParams:
     config_path: Optional[Path] = None
     debug: bool = False
     mode: InputMode = InputMode.VOCABULARY
+    workers: int = DEFAULT_FETCH_WORKERS
+    use_cache: bool = True
+    full_definitions: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BuildResult:
     deck_name: str
     deck_id: int
@@ -361,10 +427,16 @@ class NullBuildReporter:
 class RichBuildReporter(NullBuildReporter):
     """Reporter implementation that proxies events to a Rich console."""
 
-    def __init__(self, console: Console) -> None:
+    def __init__(self, console: Console, debug_log: Optional[logging.Logger] = None) -> None:
         self.console = console
+        # Debug output can run to many lines per term; with a logger it goes
+        # straight to disk instead of being retained by the recording console.
+        self.debug_log = debug_log
         self._progress: Optional[Progress] = None
         self._task_id: Optional[int] = None
+        # Advances are buffered and flushed roughly every 0.5% of the total.
+        self._pending = 0
+        self._flush_every = 1
         self.warnings: List[str] = []
         self.errors: List[str] = []
 
@@ -380,7 +452,10 @@ class RichBuildReporter(NullBuildReporter):
         self.console.print(f"[red]{message}[/]")
 
     def debug(self, message: str) -> None:
-        self.console.log(f"[magenta]DEBUG {message}")
+        if self.debug_log is not None:
+            self.debug_log.debug(message)
+        else:
+            self.console.log(f"[magenta]DEBUG {message}")
 
     def progress_start(self, total: int, description: str = "") -> None:
         if self._progress is not None:
@@ -393,18 +468,32 @@ class RichBuildReporter(NullBuildReporter):
             TimeElapsedColumn(),
             TimeRemainingColumn(),
             console=self.console,
+            # Advances are already batched; a lower redraw rate keeps the
+            # render thread out of the way of the workers.
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
         )
         self._progress.__enter__()
         self._task_id = self._progress.add_task(description, total=total)
+        self._pending = 0
+        self._flush_every = max(1, total // 200)
 
     def progress_advance(self, advance: int = 1) -> None:
         if self._progress is None or self._task_id is None:
             return
-        self._progress.advance(self._task_id, advance)
+        self._pending += advance
+        if self._pending >= self._flush_every:
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        if self._progress is None or self._task_id is None or not self._pending:
+            return
+        self._progress.advance(self._task_id, self._pending)
+        self._pending = 0
 
     def progress_finish(self) -> None:
         if self._progress is None:
             return
+        self._flush_progress()
         progress = self._progress
         self._progress = None
         self._task_id = None
@@ -414,64 +503,106 @@ class RichBuildReporter(NullBuildReporter):
 # Helpers
 # -----------------------------
 
-def read_csv_single_column(path: Path) -> List[str]:
-    """Read a CSV (any common delimiter) and return the first non-empty cell per row.
+def _read_sample_lines(f: Any, limit: int = 4096) -> List[str]:
+    """Consume roughly ``limit`` characters of whole lines from an open text file."""
+    head: List[str] = []
+    size = 0
+    for line in f:
+        head.append(line)
+        size += len(line)
+        if size >= limit:
+            break
+    return head
+
+
+def _guess_delimiter(sample: str, candidates: str = ",;\t") -> str:
+    """Return the most frequent candidate delimiter in ``sample`` (``,`` on ties)."""
+    return max(candidates, key=sample.count)
+
+
+def _probe_row_delimiter(lines: List[str], candidates: str = ",;\t|") -> str:
+    """Pick the delimiter that splits unquoted sample lines most consistently.
+
+    Each candidate scores one point per line with the same number of occurrences
+    as the first line; ties go to the candidate that appears most often in the
+    first line, and ``,`` wins when none appears at all.
+    """
+    rows = [line for line in lines if line.strip()]
+    if not rows:
+        return ","
+    first = rows[0]
+
+    def _score(delimiter: str) -> Tuple[int, int]:
+        expected = first.count(delimiter)
+        if not expected:
+            return (0, 0)
+        return (sum(1 for line in rows if line.count(delimiter) == expected), expected)
+
+    return max(candidates, key=_score)
+
+
+def iter_csv_single_column(path: Path) -> Iterator[str]:
+    """Yield the first non-empty cell of each row of a CSV (any common delimiter).
     Also tolerates single-column files with stray semicolons.
     """
-    words: List[str] = []
     with path.open("r", encoding="utf-8-sig", newline="") as f:
-        sample = f.read(4096)
-        f.seek(0)
-        # Try to sniff delimiter; fallback to regex split on ; , or TAB
-        try:
-            sniffer = csv.Sniffer()
-            dialect = sniffer.sniff(sample)
-            reader = csv.reader(f, dialect)
-            for row in reader:
-                if not row:
-                    continue
+        head = _read_sample_lines(f)
+        lines = itertools.chain(head, f)
+        sample = "".join(head)
+        # Only quoted cells need the csv module; everything else splits directly.
+        if '"' in sample:
+            for row in csv.reader(lines, delimiter=_guess_delimiter(sample)):
                 # pick first non-empty trimmed token
-                cell = next((c.strip() for c in row if c and c.strip()), "")
+                cell = next(filter(None, map(str.strip, row)), "")
                 if cell:
-                    words.append(cell)
-        except Exception:
-            # Fallback: manual split
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                tokens = [t.strip() for t in re.split(r"[;,	]", line) if t.strip()]
-                if tokens:
-                    words.append(tokens[0])
-    return words
+                    yield cell
+            return
+
+        for line in lines:
+            token = line.strip()
+            # One term per line is the common case; only split lines that need it.
+            if "," in token or ";" in token or "\t" in token:
+                token = next(filter(None, map(str.strip, _CSV_DELIMITER_RE.split(token))), "")
+            if token:
+                yield token
+
+
+def read_csv_single_column(path: Path) -> List[str]:
+    """Return every term from :func:`iter_csv_single_column` as a list."""
+    return list(iter_csv_single_column(path))
 
 
 def read_grammar_csv(path: Path) -> List[GrammarCardData]:
     """Parse a grammar CSV with question/explanation/example columns."""
 
     def _normalize(value: str) -> str:
-        return re.sub(r"[^a-z]", "", value.lower())
+        return value.lower().encode("ascii", "ignore").decode("ascii").translate(_NON_ALPHA_TABLE)
 
     required = ["question", "explanation", "example_jp", "example_en"]
     normalized_lookup = {_normalize(key): key for key in required}
 
     entries: List[GrammarCardData] = []
     with path.open("r", encoding="utf-8-sig", newline="") as f:
-        sample = f.read(4096)
-        f.seek(0)
-        try:
-            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
-        except csv.Error:
-            dialect = csv.excel
-        reader = csv.reader(f, dialect)
+        head = _read_sample_lines(f)
+        sample = "".join(head)
+        lines = itertools.chain(head, f)
+        # csv.Sniffer is only worth its cost when quoting has to be detected.
+        if '"' in sample:
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+            except csv.Error:
+                dialect = csv.excel
+            reader = csv.reader(lines, dialect)
+        else:
+            reader = csv.reader(lines, delimiter=_probe_row_delimiter(head))
 
-        mapping: Optional[Dict[str, int]] = None
+        indices: Optional[Tuple[int, ...]] = None
         for row in reader:
-            cells = [cell.strip() for cell in row]
+            cells = list(map(str.strip, row))
             if not any(cells):
                 continue
 
-            if mapping is None:
+            if indices is None:
                 normalized = [_normalize(cell) for cell in cells]
                 header_matches = {
                     normalized_lookup[val]: idx
@@ -479,46 +610,70 @@ def read_grammar_csv(path: Path) -> List[GrammarCardData]:
                     if val in normalized_lookup
                 }
                 if len(header_matches) == len(required):
-                    mapping = header_matches
+                    indices = tuple(header_matches[key] for key in required)
                     continue
-                mapping = {key: idx for idx, key in enumerate(required)}
+                indices = tuple(range(len(required)))
 
-            values: Dict[str, str] = {}
-            for key in required:
-                idx = mapping.get(key)
-                value = cells[idx] if idx is not None and idx < len(cells) else ""
-                values[key] = value
+            q_i, e_i, jp_i, en_i = indices
+            width = len(cells)
+            question = cells[q_i] if q_i < width else ""
+            explanation = cells[e_i] if e_i < width else ""
+            example_jp = cells[jp_i] if jp_i < width else ""
+            example_en = cells[en_i] if en_i < width else ""
 
-            if not values["question"]:
+            if not question:
                 # Anki requires the first field to have content; skip invalid rows
                 continue
 
             entries.append(
                 GrammarCardData(
-                    question=values["question"],
-                    explanation=values["explanation"],
-                    example_jp=values["example_jp"],
-                    example_en=values["example_en"],
+                    question=question,
+                    explanation=explanation,
+                    example_jp=example_jp,
+                    example_en=example_en,
                 )
             )
 
     return entries
 
 
+@functools.lru_cache(maxsize=4096)
 def safe_filename(base: str) -> str:
+    # Memoized: each image candidate is slugified several times (existing-file
+    # check, in-flight key, download name) and slugify transliterates every call.
+    # Already a valid slug: slugify would return it unchanged, so skip its
+    # unidecode/regex pipeline. Anything else keeps the exact slugify output so
+    # media filenames stay stable across runs.
+    if _SLUG_RE.fullmatch(base):
+        return base
     s = slugify(base, lowercase=False, separator="_")
+    # Stays on MD5: the fallback names existing media and .apkg files, so a new
+    # hash would orphan them instead of reusing them.
     return s or hashlib.md5(base.encode("utf-8")).hexdigest()[:10]
 
 
 def deterministic_guid(*parts: str) -> int:
-    h = hashlib.md5("::".join(parts).encode("utf-8")).hexdigest()
-    return int(h[:8], 16)  # genanki Note/Deck IDs are 32-bit ints OK
+    # Stays on MD5: changing the hash would change every note id and make
+    # re-imported decks duplicate the notes Anki already has.
+    # Reading the first four digest bytes gives the same value as the historical
+    # int(hexdigest()[:8], 16) without building the hex string.
+    digest = hashlib.md5("::".join(parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big")  # genanki Note/Deck IDs are 32-bit ints OK
 
 
 # -----------------------------
 # Fetchers (no-auth public sources)
 # -----------------------------
 
+def _dump_debug_json(payload: Any) -> str:
+    """Pretty-print ``payload`` for debug output, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
 def _debug_print(
     source: str,
     term: str,
@@ -530,9 +685,17 @@ def _debug_print(
     """Render a concise, human-readable snippet for debug output."""
     try:
         if isinstance(payload, str):
-            normalized = re.sub(r"\s+", " ", payload).strip()
+            # Raw HTML bodies can be hundreds of KB; collapse whitespace in a
+            # window just large enough to fill the snippet instead of the whole page.
+            text = payload.lstrip()
+            window = limit * 4
+            normalized = _WHITESPACE_RE.sub(" ", text[:window])
+            while len(normalized) <= limit and window < len(text):
+                window *= 4
+                normalized = _WHITESPACE_RE.sub(" ", text[:window])
+            normalized = normalized.strip()
         else:
-            normalized = json.dumps(payload, ensure_ascii=False, indent=2)
+            normalized = _dump_debug_json(payload)
     except Exception:
         normalized = str(payload)
 
@@ -553,6 +716,167 @@ def _require_requests() -> None:
         )
 
 
+_thread_state = threading.local()
+_response_cache: Optional[ResponseCache] = None
+_rate_limiter = HostRateLimiter(HOST_RATE_LIMITS, DEFAULT_HOST_RATE)
+_concurrency_limiter = HostConcurrencyLimiter(
+    HOST_CONCURRENCY_LIMITS, DEFAULT_HOST_CONCURRENCY
+)
+_circuit_breaker = HostCircuitBreaker(
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN_SECONDS
+)
+
+
+def _build_retry() -> Any:
+    """Return the urllib3 retry policy shared by every API session.
+
+    Transient failures (connection resets, 429 and 5xx) are retried up to three
+    times with jittered exponential backoff, so concurrent workers that failed
+    together don't retry in lockstep. A ``Retry-After`` header is honoured but
+    capped at ``MAX_RETRY_AFTER_SECONDS``: urllib3 would otherwise park a worker
+    for up to six hours.
+    """
+    from urllib3.util.retry import Retry
+
+    class _JitteredRetry(Retry):  # type: ignore[misc, valid-type]
+        def get_backoff_time(self) -> float:
+            backoff = super().get_backoff_time()
+            return backoff * random.uniform(0.5, 1.5) if backoff else 0.0
+
+        def get_retry_after(self, response: Any) -> Optional[float]:
+            retry_after = super().get_retry_after(response)
+            if retry_after is None:
+                return None
+            return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
+    return _JitteredRetry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+    )
+
+
+def _create_session() -> Any:
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=_build_retry())
+    # Image results can point at plain-http CDNs, so pool and retry those too.
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session() -> Any:
+    """Return this thread's HTTP session so connections to each API host are reused.
+
+    ``requests.Session`` is not guaranteed to be thread-safe, so every worker in
+    :func:`gather_for_terms` keeps its own session and connection pool.
+    """
+    _require_requests()
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _create_session()
+        _thread_state.session = session
+    return session
+
+
+@contextmanager
+def debug_log_file(path: Path) -> Iterator[logging.Logger]:
+    """Write debug messages to ``path`` as they happen for the duration of the block."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    logger = logging.getLogger("anki_deck_builder.debug")
+    handler = logging.FileHandler(path, mode="w", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    try:
+        yield logger
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+@contextmanager
+def response_cache(path: Path) -> Iterator[ResponseCache]:
+    """Replay API responses from an on-disk cache for the duration of the block."""
+    global _response_cache
+    cache = ResponseCache(path)
+    previous = _response_cache
+    _response_cache = cache
+    try:
+        yield cache
+    finally:
+        _response_cache = previous
+        cache.close()
+
+
+@contextmanager
+def circuit_breakers() -> Iterator[HostCircuitBreaker]:
+    """Track host failures with fresh circuit breakers for the duration of the block.
+
+    A long-lived process (the GUI) runs many builds; without this, a host that
+    tripped in one build would still be skipped at the start of the next.
+    """
+    global _circuit_breaker
+    breakers = HostCircuitBreaker(
+        CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN_SECONDS
+    )
+    previous = _circuit_breaker
+    _circuit_breaker = breakers
+    try:
+        yield breakers
+    finally:
+        _circuit_breaker = previous
+
+
+def _http_get(
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 15,
+    use_cache: bool = True,
+) -> Any:
+    """GET ``url``, serving it from the active response cache when possible."""
+    _require_requests()
+    cache = _response_cache if use_cache else None
+    if cache is not None:
+        body = cache.get(url, params)
+        if body is not None:
+            return CachedResponse(url, body)
+    _circuit_breaker.check(url)
+    _rate_limiter.acquire(url)
+    try:
+        with _concurrency_limiter.slot(url):
+            response = _get_session().get(
+                url, params=params, headers=headers or HEADERS, timeout=timeout
+            )
+    except OSError:  # requests.RequestException: timeouts, connection and retry errors
+        _circuit_breaker.record(url, ok=False)
+        raise
+    _circuit_breaker.record(url, ok=getattr(response, "status_code", 200) < 500)
+    if cache is not None and getattr(response, "status_code", None) == 200:
+        cache.set(url, params, response.text)
+    return response
+
+
+def _response_json(response: Any) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        if isinstance(response, CachedResponse):
+            # Cache replays already hold decoded text; orjson parses str directly,
+            # so skip re-encoding it through ``content``.
+            return orjson.loads(response.text)
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            return orjson.loads(content)
+    return response.json()
+
+
 def _get_japanese_tokenizer() -> Optional[Any]:
     global _jp_tokenizer_initialized, _jp_tokenizer
 
@@ -607,6 +931,11 @@ def _sentence_contains_term(tokenizer: Any, sentence: str, term: str) -> Optiona
 
 
 def _require_gtts() -> None:
+    global gTTS
+    if gTTS is None and gtts_spec is not None:
+        from gtts import gTTS as gtts_class  # type: ignore
+
+        gTTS = gtts_class
     if gTTS is None:  # pragma: no cover - triggered only when dependency missing
         raise RuntimeError(
             "The 'gTTS' package is required for audio synthesis. Install it via 'pip install gTTS'."
@@ -614,10 +943,116 @@ def _require_gtts() -> None:
 
 
 _gtts_missing_warned = False
+_gtts_warning_lock = threading.Lock()
 
 
-def generate_term_audio(term: str, reading: str, media_dir: Path) -> str:
+def _gtts_available() -> bool:
+    """Return whether gTTS can be used, printing the install hint only once."""
     global _gtts_missing_warned
+    try:
+        _require_gtts()
+    except RuntimeError as exc:
+        # Audio is generated from several worker threads; warn exactly once.
+        with _gtts_warning_lock:
+            if not _gtts_missing_warned:
+                message = str(exc)
+                if hasattr(console, "print"):
+                    console.print(f"[red]{message}")
+                else:  # pragma: no cover - exercised in tests with dummy console
+                    console.log(message)
+                _gtts_missing_warned = True
+        return False
+    return True
+
+
+def _media_file_exists(dest: Path) -> bool:
+    """Return True when ``dest`` is a non-empty file left by an earlier run."""
+    try:
+        return dest.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _save_tts(text: str, dest: Path) -> None:
+    """Synthesize ``text`` into ``dest`` without ever exposing a partial file.
+
+    Audio that already exists is reused on later runs, so an interrupted save
+    must not leave a truncated mp3 behind under the final name.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=str(dest.parent), prefix=f".{dest.name}.", suffix=".part"
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        gTTS(text=text, lang="ja").save(tmp_name)  # type: ignore[misc]
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Audio/image jobs keyed by destination; only set inside shared_media_jobs().
+_media_jobs: Optional[Dict[str, "Future[str]"]] = None
+_media_jobs_lock = threading.Lock()
+
+
+@contextmanager
+def shared_media_jobs() -> Iterator[None]:
+    """Let concurrent terms share audio and image jobs for the duration of the block.
+
+    The job map lives only as long as the block, so a long-lived process (the GUI)
+    does not keep every destination and finished job from earlier builds.
+    """
+    global _media_jobs
+    previous = _media_jobs
+    _media_jobs = {}
+    try:
+        yield
+    finally:
+        _media_jobs = previous
+
+
+def _produce_once(dest: Path, produce: Callable[[], str]) -> str:
+    """Run ``produce`` for ``dest`` at most once per :func:`shared_media_jobs` block.
+
+    Media filenames are derived from the spoken text or search term, so identical
+    example sentences or image candidates shared by several terms map to the same
+    ``dest``. Concurrent callers wait for the first job instead of racing to write
+    the same file; later callers reuse its result (a filename in ``dest.parent``)
+    while that file is still on disk. Outside a block, ``produce`` simply runs.
+    """
+    jobs = _media_jobs
+    if jobs is None:
+        return produce()
+    key = str(dest)
+    with _media_jobs_lock:
+        job = jobs.get(key)
+        reusable = job is not None and (
+            not job.done()
+            or (
+                job.exception() is None
+                and job.result()
+                and (dest.parent / job.result()).exists()
+            )
+        )
+        if not reusable:
+            job = Future()
+            jobs[key] = job
+            owner = True
+        else:
+            owner = False
+    assert job is not None
+    if owner:
+        try:
+            job.set_result(produce())
+        except BaseException as exc:
+            job.set_exception(exc)
+            raise
+    return job.result()
+
+
+def generate_term_audio(term: str, reading: str, media_dir: Path) -> str:
     candidates = []
     if term and term.strip():
         candidates.append(term.strip())
@@ -627,69 +1062,69 @@ def generate_term_audio(term: str, reading: str, media_dir: Path) -> str:
     if not candidates:
         return ""
 
-    try:
-        _require_gtts()
-    except RuntimeError as exc:
-        if not _gtts_missing_warned:
-            message = str(exc)
-            if hasattr(console, "print"):
-                console.print(f"[red]{message}")
-            else:  # pragma: no cover - exercised in tests with dummy console
-                console.log(message)
-            _gtts_missing_warned = True
-        return ""
-
     filename_seed = candidates[0]
     filename = safe_filename(f"{filename_seed}_audio") + ".mp3"
     dest = media_dir / filename
+    if _media_file_exists(dest):
+        return filename
 
-    for idx, text in enumerate(candidates):
-        try:
-            tts = gTTS(text=text, lang="ja")  # type: ignore[misc]
-            tts.save(str(dest))
-            return filename
-        except Exception as e:  # pragma: no cover - network or library specific failures
-            if dest.exists():
-                dest.unlink()
-            console.log(f"[yellow]gTTS synthesis failed for '{text}': {e}")
-            if idx == len(candidates) - 1:
-                return ""
-    return ""
+    if not _gtts_available():
+        return ""
+
+    def _synthesize() -> str:
+        for idx, text in enumerate(candidates):
+            try:
+                _save_tts(text, dest)
+                return filename
+            except Exception as e:  # pragma: no cover - network or library specific failures
+                console.log(f"[yellow]gTTS synthesis failed for '{text}': {e}")
+                if idx == len(candidates) - 1:
+                    return ""
+        return ""
+
+    return _produce_once(dest, _synthesize)
 
 
 def generate_sentence_audio(sentence: str, media_dir: Path) -> str:
-    global _gtts_missing_warned
     if not sentence or not sentence.strip():
         return ""
 
-    try:
-        _require_gtts()
-    except RuntimeError as exc:
-        if not _gtts_missing_warned:
-            message = str(exc)
-            if hasattr(console, "print"):
-                console.print(f"[red]{message}")
-            else:  # pragma: no cover - exercised in tests with dummy console
-                console.log(message)
-            _gtts_missing_warned = True
-        return ""
-
     text = sentence.strip()
     base = text[:30]
+    # Stays on MD5: the suffix names clips from earlier runs, which are reused
+    # only while the filename is unchanged.
     hash_suffix = hashlib.md5(text.encode("utf-8")).hexdigest()[:8]
     filename = safe_filename(f"{base}_{hash_suffix}_sentence_audio") + ".mp3"
     dest = media_dir / filename
-
-    try:
-        tts = gTTS(text=text, lang="ja")  # type: ignore[misc]
-        tts.save(str(dest))
+    if _media_file_exists(dest):
         return filename
-    except Exception as e:  # pragma: no cover - network or library specific failures
-        if dest.exists():
-            dest.unlink()
-        console.log(f"[yellow]gTTS synthesis failed for sentence '{text}': {e}")
+
+    if not _gtts_available():
         return ""
 
+    def _synthesize() -> str:
+        try:
+            _save_tts(text, dest)
+            return filename
+        except Exception as e:  # pragma: no cover - network or library specific failures
+            console.log(f"[yellow]gTTS synthesis failed for sentence '{text}': {e}")
+            return ""
+
+    return _produce_once(dest, _synthesize)
+
+
+def _select_jisho_entry(entries: List[JishoEntry], term: str) -> JishoEntry:
+    """Prefer the entry whose written form (or, failing that, reading) is ``term``.
+
+    Jisho ranks common compounds and related words alongside the exact match, so
+    the first entry is not always the requested word.
+    """
+    for key in ("word", "reading"):
+        for entry in entries:
+            if any(getattr(form, key) == term for form in entry.japanese):
+                return entry
+    return entries[0]
+
 
 def fetch_jisho(
     term: str,
@@ -697,53 +1132,126 @@ def fetch_jisho(
     logger: Optional[Callable[[str], None]] = None,
 ) -> Tuple[str, str]:
     """Return (reading_kana, english_glosses) from Jisho for a term."""
+    reading, english, _sense_count = fetch_jisho_entry(term, debug=debug, logger=logger)
+    return reading, english
+
+
+def fetch_jisho_entry(
+    term: str,
+    debug: bool = False,
+    logger: Optional[Callable[[str], None]] = None,
+) -> Tuple[str, str, int]:
+    """Return (reading_kana, english_glosses, sense_count) from Jisho for a term.
+
+    ``sense_count`` is the number of senses with English definitions in the
+    selected entry, which the joined gloss string cannot tell apart from a
+    single definition containing commas or "and".
+    """
     _require_requests()
     try:
-        resp = requests.get(JISHO_URL, params={"keyword": term}, headers=HEADERS, timeout=15)
-        if debug and logger is not None:
-            logger(f"DEBUG raw Jisho response for '{term}': {resp.text}")
-        elif debug:
-            console.log(
-                f"[cyan]DEBUG Jisho response for '{term}':[/] {resp.text}"
-            )
+        resp = _http_get(JISHO_URL, params={"keyword": term}, headers=HEADERS, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        content = getattr(resp, "content", None)
+        response = (
+            decode_jisho_response(content)
+            if isinstance(content, (bytes, str))
+            else None
+        )
+        if response is None:
+            response = jisho_response_from_json(_response_json(resp))
         if debug:
-            first_entry = (data.get("data") or [{}])[0] if data.get("data") else {}
+            first_entry = response.data[0] if response.data else JishoEntry()
             summary = {
-                "meta": data.get("meta", {}),
-                "first_japanese": first_entry.get("japanese", []),
+                "meta": response.meta,
+                "first_japanese": [
+                    {"word": form.word, "reading": form.reading}
+                    for form in first_entry.japanese
+                ],
                 "first_sense": {},
             }
-            senses = first_entry.get("senses", []) if isinstance(first_entry, dict) else []
-            if senses:
-                first_sense = senses[0] if isinstance(senses[0], dict) else {}
+            if first_entry.senses:
+                first_sense = first_entry.senses[0]
                 summary["first_sense"] = {
-                    "parts_of_speech": first_sense.get("parts_of_speech", []),
-                    "english_definitions": first_sense.get("english_definitions", []),
-                    "tags": first_sense.get("tags", []),
+                    "parts_of_speech": first_sense.parts_of_speech,
+                    "english_definitions": first_sense.english_definitions,
+                    "tags": first_sense.tags,
                 }
             _debug_print("Jisho", term, summary, logger=logger)
-        if not data.get("data"):
-            return "", ""
-        first = data["data"][0]
-        reading = (first.get("japanese", [{}])[0] or {}).get("reading", "")
+        if not response.data:
+            return "", "", 0
+        first = _select_jisho_entry(response.data, term)
+        reading = first.japanese[0].reading if first.japanese else None
         # Combine first sense's english_definitions (fallback to joining all senses)
-        senses = first.get("senses", [])
-        if senses:
-            defs_primary = senses[0].get("english_definitions", [])
-            if defs_primary:
-                english = "; ".join(defs_primary)
-            else:
-                english = "; ".join(
-                    [", ".join(s.get("english_definitions", [])) for s in senses if s.get("english_definitions")]
-                )
+        glossed = [sense.english_definitions for sense in first.senses if sense.english_definitions]
+        if first.senses and first.senses[0].english_definitions:
+            english = "; ".join(first.senses[0].english_definitions)
         else:
-            english = ""
-        return reading or "", english or ""
+            english = "; ".join(", ".join(defs) for defs in glossed)
+        return reading or "", english, len(glossed)
     except Exception as e:
         console.log(f"[yellow]Jisho fetch failed for '{term}': {e}")
-        return "", ""
+        return "", "", 0
+
+
+TATOEBA_SHORT_SENTENCE_LENGTH = 20
+
+
+def _select_tatoeba_candidate(pool: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Pick the best Tatoeba candidate in a single pass over ``pool``.
+
+    In order of preference: the longest tokenizer-validated sentence, the shortest
+    sentence containing the term verbatim, the longest sentence of at most
+    ``TATOEBA_SHORT_SENTENCE_LENGTH`` characters, and finally the longest overall.
+    Ties go to the earliest candidate.
+    """
+    validated: Optional[Dict[str, Any]] = None
+    contains_term: Optional[Dict[str, Any]] = None
+    short: Optional[Dict[str, Any]] = None
+    longest: Optional[Dict[str, Any]] = None
+    for candidate in pool:
+        length = candidate.get("length", 0)
+        if candidate.get("token_match") is True and (
+            validated is None or length > validated.get("length", 0)
+        ):
+            validated = candidate
+        if candidate.get("contains_term") and (
+            contains_term is None or length < contains_term.get("length", 0)
+        ):
+            contains_term = candidate
+        if length <= TATOEBA_SHORT_SENTENCE_LENGTH and (
+            short is None or length > short.get("length", 0)
+        ):
+            short = candidate
+        if longest is None or length > longest.get("length", 0):
+            longest = candidate
+    return validated or contains_term or short or longest or {}
+
+
+def _first_english_translation(translations: Any) -> str:
+    """Return the first non-empty English text from a Tatoeba ``translations`` field.
+
+    The API returns either a list of translation dicts (optionally grouped into
+    nested lists) or a dict keyed by language code.
+    """
+    if isinstance(translations, list):
+        for item in translations:
+            group = item if isinstance(item, list) else (item,)
+            for trans in group:
+                if isinstance(trans, dict) and trans.get("lang") in ("eng", "en"):
+                    text = (trans.get("text") or "").strip()
+                    if text:
+                        return text
+    elif isinstance(translations, dict):
+        for key in ("eng", "en"):
+            items = translations.get(key)
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                if isinstance(item, dict):
+                    text = (item.get("text") or "").strip()
+                    if text:
+                        return text
+    return ""
 
 
 def fetch_tatoeba_example(
@@ -774,47 +1282,23 @@ def fetch_tatoeba_example(
             token_match: Optional[bool] = _sentence_contains_term(tokenizer, jp_text, term)
             if token_match is False:
                 continue
-            translations = res.get("translations")
-            english_texts: List[str] = []
-
-            if isinstance(translations, list):
-                flat: List[Dict[str, Any]] = []
-                for item in translations:
-                    if isinstance(item, dict):
-                        flat.append(item)
-                    elif isinstance(item, list):
-                        flat.extend([sub for sub in item if isinstance(sub, dict)])
-                for trans in flat:
-                    if trans.get("lang") in ("eng", "en"):
-                        text = (trans.get("text") or "").strip()
-                        if text:
-                            english_texts.append(text)
-            elif isinstance(translations, dict):
-                for key in ("eng", "en"):
-                    items = translations.get(key)
-                    if not isinstance(items, list):
-                        continue
-                    for item in items:
-                        if isinstance(item, dict):
-                            text = (item.get("text") or "").strip()
-                            if text:
-                                english_texts.append(text)
-
-            if not english_texts:
+            # Candidates for the same sentence only differ in their translation and
+            # ties go to the earliest, so the first English translation is enough.
+            en_text = _first_english_translation(res.get("translations"))
+            if not en_text:
                 continue
 
-            jp_length = len(re.sub(r"\s+", "", jp_text))
-            for en_text in english_texts:
-                candidate = {
-                    "jp": jp_text,
-                    "en": en_text,
-                    "length": jp_length,
-                    "native": native,
-                    "contains_term": term in jp_text,
-                }
-                if token_match is not None:
-                    candidate["token_match"] = token_match
-                candidates.append(candidate)
+            candidate = {
+                "jp": jp_text,
+                "en": en_text,
+                # str.split() drops the same Unicode whitespace as \s, without a regex pass.
+                "length": len("".join(jp_text.split())),
+                "native": native,
+                "contains_term": term in jp_text,
+            }
+            if token_match is not None:
+                candidate["token_match"] = token_match
+            candidates.append(candidate)
         return candidates
 
     def _perform_request(extra_params: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
@@ -827,9 +1311,9 @@ def fetch_tatoeba_example(
             "trans_to": "eng",
         }
         params.update(extra_params)
-        response = requests.get(TATOEBA_URL, params=params, headers=HEADERS, timeout=20)
+        response = _http_get(TATOEBA_URL, params=params, headers=HEADERS, timeout=20)
         response.raise_for_status()
-        payload = response.json()
+        payload = _response_json(response)
         if not isinstance(payload, dict):
             payload = {}
 
@@ -895,33 +1379,16 @@ def fetch_tatoeba_example(
                     break
             return aggregated, token_match_found
 
-        native_candidates, native_match = _search_pages({"native": "yes"})
-        all_candidates = list(native_candidates)
+        # Native sentences always win over the unfiltered search, so that search
+        # is only worth its requests when the native one came back empty.
+        search_pool, _ = _search_pages({"native": "yes"})
+        if not search_pool:
+            search_pool, _ = _search_pages({})
 
-        if not native_match:
-            fallback_candidates, _ = _search_pages({})
-            all_candidates.extend(fallback_candidates)
-
-        if not all_candidates:
+        if not search_pool:
             return "", ""
 
-        preferred = [c for c in all_candidates if c.get("native")]
-        search_pool = preferred if preferred else all_candidates
-        validated = [c for c in search_pool if c.get("token_match") is True]
-        contains_term = [c for c in search_pool if c.get("contains_term")]
-        if validated:
-            effective_pool = validated
-            best = max(effective_pool, key=lambda c: c.get("length", 0))
-        elif contains_term:
-            effective_pool = contains_term
-            best = min(effective_pool, key=lambda c: c.get("length", 0))
-        else:
-            effective_pool = search_pool
-            best = max(effective_pool, key=lambda c: c.get("length", 0))
-            if best.get("length", 0) > 20:
-                short_candidates = [c for c in effective_pool if c.get("length", 0) <= 20]
-                if short_candidates:
-                    best = max(short_candidates, key=lambda c: c.get("length", 0))
+        best = _select_tatoeba_candidate(search_pool)
         return best.get("jp", ""), best.get("en", "")
     except Exception as e:
         console.log(f"[yellow]Tatoeba fetch failed for '{term}': {e}")
@@ -939,7 +1406,7 @@ def fetch_kotobank_ja_definition(
     for url_template in (KOTOBANK_ENTRY_URL, KOTOBANK_SEARCH_URL):
         url = url_template.format(term=encoded)
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=15)
+            resp = _http_get(url, headers=HEADERS, timeout=15)
             resp.raise_for_status()
             if debug:
                 _debug_print("Kotobank", term, f"URL: {url}\n{resp.text}", logger=logger)
@@ -969,9 +1436,9 @@ def fetch_wiktionary_ja_definition(
             "titles": term,
             "redirects": 1,
         }
-        r = requests.get(WIKTIONARY_JA_API, params=params, headers=HEADERS, timeout=15)
+        r = _http_get(WIKTIONARY_JA_API, params=params, headers=HEADERS, timeout=15)
         r.raise_for_status()
-        j = r.json()
+        j = _response_json(r)
         pages = (j.get("query", {}) or {}).get("pages", {})
         if debug:
             first_page: Dict[str, Any] = {}
@@ -1012,15 +1479,9 @@ def fetch_wikipedia_ja_definition(
             "titles": term,
             "redirects": 1,
         }
-        r = requests.get(WIKIPEDIA_JA_API, params=params, headers=HEADERS, timeout=15)
+        r = _http_get(WIKIPEDIA_JA_API, params=params, headers=HEADERS, timeout=15)
         r.raise_for_status()
-        if debug and logger is not None:
-            logger(f"DEBUG raw Wikipedia JA response for '{term}': {r.text}")
-        elif debug:
-            console.log(
-                f"[cyan]DEBUG Wikipedia JA response for '{term}':[/] {r.text}"
-            )
-        j = r.json()
+        j = _response_json(r)
         if debug:
             pages = (j.get("query", {}) or {}).get("pages", {})
             first_page: Dict[str, Any] = {}
@@ -1045,18 +1506,214 @@ def fetch_wikipedia_ja_definition(
         return ""
 
 
+def _fetch_wikipedia_batch(titles: List[str]) -> Dict[str, str]:
+    """Look up intro extracts for up to ``WIKIPEDIA_BATCH_SIZE`` titles in one query.
+
+    Titles whose page could not be resolved from the response (for example when
+    MediaWiki truncates the batch) are left out so callers fetch them one by one.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "prop": "extracts",
+        "exintro": 1,
+        "explaintext": 1,
+        "exlimit": len(titles),
+        "titles": "|".join(titles),
+        "redirects": 1,
+    }
+    r = _http_get(WIKIPEDIA_JA_API, params=params, headers=HEADERS, timeout=15)
+    r.raise_for_status()
+    pages = _resolve_batch_pages(_response_json(r).get("query", {}) or {}, titles)
+
+    definitions: Dict[str, str] = {}
+    for title, page in pages.items():
+        if "missing" in page or "invalid" in page:
+            definitions[title] = ""
+        elif "extract" in page:
+            extract = page.get("extract") or ""
+            definitions[title] = clean_wikipedia_extract(extract) if extract else ""
+    return definitions
+
+
+def _resolve_batch_pages(query: Dict[str, Any], titles: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Map each requested title onto the page MediaWiki returned for it.
+
+    MediaWiki reports title normalisation and redirects separately, so those
+    are chained to find the page that was actually returned. Titles with no
+    resolvable page are left out.
+    """
+    aliases: Dict[str, str] = {}
+    for key in ("normalized", "redirects"):
+        for item in query.get(key) or []:
+            if isinstance(item, dict) and item.get("from") and item.get("to"):
+                aliases[item["from"]] = item["to"]
+
+    pages = query.get("pages") or {}
+    by_title: Dict[str, Dict[str, Any]] = {}
+    for page in pages.values() if isinstance(pages, dict) else pages:
+        if isinstance(page, dict) and page.get("title"):
+            by_title[page["title"]] = page
+
+    resolved_pages: Dict[str, Dict[str, Any]] = {}
+    for title in titles:
+        resolved = title
+        seen = {resolved}
+        while resolved not in by_title and aliases.get(resolved) not in (None, *seen):
+            resolved = aliases[resolved]
+            seen.add(resolved)
+        if resolved in by_title:
+            resolved_pages[title] = by_title[resolved]
+    return resolved_pages
+
+
+def _fetch_in_batches(
+    terms: List[str],
+    batch_size: int,
+    fetch_batch: Callable[[List[str]], Dict[str, Any]],
+    *,
+    label: str,
+    max_workers: int,
+) -> Tuple[Dict[str, Any], int, int]:
+    """Run ``fetch_batch`` over de-duplicated ``terms`` in chunks of ``batch_size``.
+
+    Returns the merged results with the number of unique terms and of requests.
+    A failed batch is logged and contributes nothing, so its terms fall back to
+    per-term lookups.
+    """
+    unique_terms = list(dict.fromkeys(term for term in terms if term))
+    batches = [
+        unique_terms[start : start + batch_size]
+        for start in range(0, len(unique_terms), batch_size)
+    ]
+
+    def _run(batch: List[str]) -> Dict[str, Any]:
+        try:
+            return fetch_batch(batch)
+        except Exception as e:
+            console.log(f"[yellow]{label} batch fetch failed for {len(batch)} term(s): {e}")
+            return {}
+
+    results: Dict[str, Any] = {}
+    if batches:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            for result in executor.map(_run, batches):
+                results.update(result)
+    return results, len(unique_terms), len(batches)
+
+
+def fetch_wikipedia_ja_definitions(
+    terms: List[str],
+    *,
+    debug: bool = False,
+    logger: Optional[Callable[[str], None]] = None,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+) -> Dict[str, str]:
+    """Prefetch Japanese Wikipedia definitions for many terms, 20 titles per request.
+
+    Terms absent from the returned mapping could not be resolved in bulk and
+    should go through :func:`fetch_wikipedia_ja_definition` instead.
+    """
+    _require_requests()
+    definitions, unique, requests_made = _fetch_in_batches(
+        terms,
+        WIKIPEDIA_BATCH_SIZE,
+        _fetch_wikipedia_batch,
+        label="Wikipedia JA",
+        max_workers=max_workers,
+    )
+    if debug and requests_made:
+        _debug_print(
+            "Wikipedia JA batch",
+            f"{unique} terms",
+            {"requests": requests_made, "resolved": len(definitions)},
+            logger=logger,
+        )
+    return definitions
+
+
+def _fetch_wiktionary_titles_batch(titles: List[str]) -> Dict[str, bool]:
+    """Report which of up to ``WIKTIONARY_BATCH_SIZE`` titles have a Wiktionary page."""
+    params = {
+        "action": "query",
+        "format": "json",
+        "titles": "|".join(titles),
+        "redirects": 1,
+    }
+    r = _http_get(WIKTIONARY_JA_API, params=params, headers=HEADERS, timeout=15)
+    r.raise_for_status()
+    pages = _resolve_batch_pages(_response_json(r).get("query", {}) or {}, titles)
+    return {
+        title: "missing" not in page and "invalid" not in page
+        for title, page in pages.items()
+    }
+
+
+def fetch_wiktionary_ja_titles(
+    terms: List[str],
+    *,
+    debug: bool = False,
+    logger: Optional[Callable[[str], None]] = None,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+) -> Dict[str, bool]:
+    """Check which terms have a Japanese Wiktionary page, 50 titles per request.
+
+    Full-page extracts can only be fetched one title at a time, so this lets
+    callers skip that request for terms without a page. Terms absent from the
+    mapping could not be checked and should be looked up as usual.
+    """
+    _require_requests()
+    pages, unique, requests_made = _fetch_in_batches(
+        terms,
+        WIKTIONARY_BATCH_SIZE,
+        _fetch_wiktionary_titles_batch,
+        label="Wiktionary JA",
+        max_workers=max_workers,
+    )
+    if debug and requests_made:
+        _debug_print(
+            "Wiktionary JA batch",
+            f"{unique} terms",
+            {"requests": requests_made, "with_page": sum(pages.values())},
+            logger=logger,
+        )
+    return pages
+
+
+def _find_existing_image(term: str, media_dir: Path) -> str:
+    """Return a previously downloaded image for ``term`` (any extension), if present."""
+    stem = safe_filename(f"{term}_img")
+    for candidate in sorted(media_dir.glob(f"{stem}.*")):
+        if candidate.is_file() and candidate.stat().st_size > 0:
+            return candidate.name
+    return ""
+
+
 def fetch_duckduckgo_image(term: str, media_dir: Path) -> str:
     """Download first DuckDuckGo image search result. Return local filename or ''."""
     _require_requests()
+    existing = _find_existing_image(term, media_dir)
+    if existing:
+        return existing
+    # Terms often fall back to the same English gloss; search and download once.
+    return _produce_once(
+        media_dir / safe_filename(f"{term}_img"),
+        lambda: _search_and_download_image(term, media_dir),
+    )
+
+
+def _search_and_download_image(term: str, media_dir: Path) -> str:
     try:
-        search_resp = requests.get(
+        # The vqd token is short-lived, so image search responses are never cached.
+        search_resp = _http_get(
             DUCKDUCKGO_BASE,
             params={"q": term, "iax": "images", "ia": "images"},
             headers=HEADERS,
             timeout=20,
+            use_cache=False,
         )
         search_resp.raise_for_status()
-        match = re.search(r"vqd=['\"]?([\w-]+)['\"]?", search_resp.text)
+        match = _VQD_RE.search(search_resp.text)
         if not match:
             return ""
         vqd = match.group(1)
@@ -1070,44 +1727,93 @@ def fetch_duckduckgo_image(term: str, media_dir: Path) -> str:
             "p": "1",
         }
         headers = {**HEADERS, "Referer": DUCKDUCKGO_BASE}
-        r = requests.get(
+        r = _http_get(
             f"{DUCKDUCKGO_BASE}i.js",
             params=params,
             headers=headers,
             timeout=20,
+            use_cache=False,
         )
         r.raise_for_status()
-        data = r.json()
+        data = _response_json(r)
         results = data.get("results") or []
-        if not results:
-            return ""
-        url = results[0].get("image") or results[0].get("thumbnail")
-        if not url:
-            return ""
+    except Exception as e:
+        console.log(f"[yellow]DuckDuckGo image search failed for '{term}': {e}")
+        return ""
 
+    # A single search already lists several images; if a host refuses the first
+    # download, try the next results before the caller re-searches with another
+    # candidate term.
+    last_error: Optional[Exception] = None
+    for result in results[:DUCKDUCKGO_MAX_DOWNLOAD_ATTEMPTS]:
+        if not isinstance(result, dict):
+            continue
+        # Cards render images at half width, so the proxied thumbnail is plenty
+        # and far smaller than the original upload.
+        url = result.get("thumbnail") or result.get("image")
+        if not url:
+            continue
         suffix = os.path.splitext(url.split("?")[0])[1]
         if not suffix:
             suffix = ".jpg"
         fn = safe_filename(f"{term}_img") + suffix
-        dest = media_dir / fn
-        with requests.get(url, headers=headers, timeout=30, stream=True) as img:
-            img.raise_for_status()
-            with open(dest, "wb") as out:
-                for chunk in img.iter_content(chunk_size=65536):
-                    if chunk:
-                        out.write(chunk)
+        try:
+            _download_image(url, media_dir / fn, headers)
+        except Exception as e:
+            last_error = e
+            continue
         return fn
-    except Exception as e:
-        console.log(f"[yellow]DuckDuckGo image fetch failed for '{term}': {e}")
-        return ""
+    if last_error is not None:
+        console.log(f"[yellow]DuckDuckGo image fetch failed for '{term}': {last_error}")
+    return ""
+
+
+def _download_image(url: str, dest: Path, headers: Dict[str, str]) -> None:
+    """Stream ``url`` into ``dest`` atomically.
+
+    The body goes to a hidden temporary file next to ``dest`` and is only renamed
+    into place once complete, so an interrupted run never leaves a truncated image
+    that ``_find_existing_image`` would later reuse. Bodies over
+    ``MAX_IMAGE_BYTES`` are rejected from the ``Content-Length`` header when the
+    server sends one, and otherwise as soon as the limit is crossed.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=str(dest.parent), prefix=f".{dest.name}.", suffix=".part"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            _rate_limiter.acquire(url)
+            with _concurrency_limiter.slot(url), _get_session().get(
+                url, headers=headers, timeout=30, stream=True
+            ) as img:
+                img.raise_for_status()
+                declared = img.headers.get("Content-Length")
+                if declared and declared.isdigit() and int(declared) > MAX_IMAGE_BYTES:
+                    raise ValueError(f"image too large ({declared} bytes)")
+                # Read straight from the urllib3 stream; gzip/deflate bodies are
+                # still decoded because decode_content is switched on.
+                img.raw.decode_content = True
+                written = 0
+                while True:
+                    chunk = img.raw.read(IMAGE_DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if written > MAX_IMAGE_BYTES:
+                        raise ValueError(f"image larger than {MAX_IMAGE_BYTES} bytes")
+                    out.write(chunk)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 # -----------------------------
 # Anki model/deck helpers
 # -----------------------------
 
-def build_model(model_id: int, name: str = DEFAULT_MODEL_NAME) -> genanki.Model:
-    css = """
+VOCAB_CSS = """
     .jp { font-family: 'Hiragino Kaku Gothic Pro', 'Meiryo', 'Noto Sans JP', sans-serif; font-size: 28px; }
     .reading { color: #555; font-size: 20px; }
     .en { margin-top: 8px; font-size: 16px; }
@@ -1118,6 +1824,18 @@ def build_model(model_id: int, name: str = DEFAULT_MODEL_NAME) -> genanki.Model:
     .front { text-align: center; }
     .back { text-align: left; }
     """
+
+GRAMMAR_CSS = """
+    .question { font-family: 'Hiragino Kaku Gothic Pro', 'Meiryo', 'Noto Sans JP', sans-serif; font-size: 28px; }
+    .example { margin-top: 12px; font-size: 18px; }
+    .explanation { margin-top: 16px; font-size: 18px; }
+    .audio { margin-top: 8px; font-size: 18px; }
+    .card { text-align: left; }
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def build_model(model_id: int, name: str = DEFAULT_MODEL_NAME) -> genanki.Model:
     fields = [
         {"name": "Expression"},
         {"name": "Reading"},
@@ -1160,7 +1878,7 @@ def build_model(model_id: int, name: str = DEFAULT_MODEL_NAME) -> genanki.Model:
 """,
         }
     ]
-    return genanki.Model(model_id, name, fields=fields, templates=templates, css=css)
+    return genanki.Model(model_id, name, fields=fields, templates=templates, css=VOCAB_CSS)
 
 
 def make_note(model: genanki.Model, cd: CardData) -> genanki.Note:
@@ -1173,16 +1891,10 @@ def make_note(model: genanki.Model, cd: CardData) -> genanki.Note:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def build_grammar_model(
     model_id: int, name: str = DEFAULT_GRAMMAR_MODEL_NAME
 ) -> genanki.Model:
-    css = """
-    .question { font-family: 'Hiragino Kaku Gothic Pro', 'Meiryo', 'Noto Sans JP', sans-serif; font-size: 28px; }
-    .example { margin-top: 12px; font-size: 18px; }
-    .explanation { margin-top: 16px; font-size: 18px; }
-    .audio { margin-top: 8px; font-size: 18px; }
-    .card { text-align: left; }
-    """
     fields = [
         {"name": "Question"},
         {"name": "Explanation"},
@@ -1210,7 +1922,7 @@ def build_grammar_model(
 """,
         }
     ]
-    return genanki.Model(model_id, name, fields=fields, templates=templates, css=css)
+    return genanki.Model(model_id, name, fields=fields, templates=templates, css=GRAMMAR_CSS)
 
 
 def make_grammar_note(model: genanki.Model, cd: GrammarCardData) -> genanki.Note:
@@ -1232,8 +1944,29 @@ def gather_for_term(
     media_dir: Path,
     debug: bool = False,
     logger: Optional[Callable[[str], None]] = None,
+    wikipedia_definition: Optional[str] = None,
+    side_executor: Optional[Executor] = None,
+    full_definitions: bool = True,
+    has_wiktionary_page: Optional[bool] = None,
 ) -> CardData:
-    reading, english = fetch_jisho(term, debug=debug, logger=logger)
+    """Fetch everything needed for one vocabulary card.
+
+    ``wikipedia_definition`` is a result already prefetched in bulk by
+    :func:`fetch_wikipedia_ja_definitions`; ``None`` means look it up here.
+    Likewise ``has_wiktionary_page=False`` (from :func:`fetch_wiktionary_ja_titles`)
+    skips the Wiktionary request for a term known to have no page.
+    With a ``side_executor``, the Tatoeba lookup runs alongside Jisho, and speech
+    synthesis starts as soon as its text is known, overlapping with the
+    remaining definition and image lookups. Jobs on it never wait on each other.
+    With ``full_definitions=False``, the Wiktionary/Kotobank fallbacks are
+    skipped for terms whose Jisho entry already has several English glosses.
+    """
+    tatoeba_job: Optional["Future[Tuple[str, str]]"] = None
+    if side_executor is not None:
+        tatoeba_job = side_executor.submit(
+            fetch_tatoeba_example, term, debug=debug, logger=logger
+        )
+    reading, english, sense_count = fetch_jisho_entry(term, debug=debug, logger=logger)
     if debug:
         message = (
             f"Parsed Jisho for '{term}': reading={reading!r}, english={english!r}"
@@ -1242,7 +1975,16 @@ def gather_for_term(
             logger(message)
         else:
             console.log(f"[magenta]DEBUG {message}")
-    jp_ex, en_ex = fetch_tatoeba_example(term, debug=debug, logger=logger)
+    term_audio_job: Optional["Future[str]"] = None
+    if side_executor is not None:
+        term_audio_job = side_executor.submit(generate_term_audio, term, reading, media_dir)
+    if tatoeba_job is not None:
+        jp_ex, en_ex = tatoeba_job.result()
+    else:
+        jp_ex, en_ex = fetch_tatoeba_example(term, debug=debug, logger=logger)
+    sentence_audio_job: Optional["Future[str]"] = None
+    if side_executor is not None:
+        sentence_audio_job = side_executor.submit(generate_sentence_audio, jp_ex, media_dir)
     if debug:
         message = (
             f"Parsed Tatoeba for '{term}': sentence_jp={jp_ex!r}, sentence_en={en_ex!r}"
@@ -1251,14 +1993,24 @@ def gather_for_term(
             logger(message)
         else:
             console.log(f"[magenta]DEBUG {message}")
-    defi = fetch_wikipedia_ja_definition(term, debug=debug, logger=logger)
+    if wikipedia_definition is None:
+        defi = fetch_wikipedia_ja_definition(term, debug=debug, logger=logger)
+    else:
+        defi = wikipedia_definition
     if debug:
         message = f"Parsed Wikipedia definition for '{term}': definition={defi!r}"
         if logger is not None:
             logger(message)
         else:
             console.log(f"[magenta]DEBUG {message}")
-    if not defi:
+    chase_fallbacks = full_definitions or sense_count < RICH_GLOSS_MIN_SENSES
+    if not defi and not chase_fallbacks and debug:
+        message = f"Skipping definition fallbacks for '{term}': Jisho gloss is enough"
+        if logger is not None:
+            logger(message)
+        else:
+            console.log(f"[magenta]DEBUG {message}")
+    if not defi and chase_fallbacks and has_wiktionary_page is not False:
         defi = fetch_wiktionary_ja_definition(term, debug=debug, logger=logger)
         if debug:
             message = (
@@ -1268,7 +2020,7 @@ def gather_for_term(
                 logger(message)
             else:
                 console.log(f"[magenta]DEBUG {message}")
-    if not defi:
+    if not defi and chase_fallbacks:
         defi = fetch_kotobank_ja_definition(term, debug=debug, logger=logger)
         if debug:
             message = f"Parsed Kotobank definition for '{term}': definition={defi!r}"
@@ -1282,9 +2034,7 @@ def gather_for_term(
 
     if english:
         # Use the first few English gloss candidates as fallbacks for image lookup.
-        english_candidates = [
-            e.strip() for e in re.split(r"(?i)[;,/]|\band\b", english) if e.strip()
-        ]
+        english_candidates = filter(None, map(str.strip, _ENGLISH_GLOSS_SPLIT_RE.split(english)))
         for candidate in english_candidates:
             if candidate not in search_terms:
                 search_terms.append(candidate)
@@ -1297,8 +2047,14 @@ def gather_for_term(
         if img:
             break
 
-    audio = generate_term_audio(term, reading, media_dir)
-    sentence_audio = generate_sentence_audio(jp_ex, media_dir)
+    if term_audio_job is not None:
+        audio = term_audio_job.result()
+    else:
+        audio = generate_term_audio(term, reading, media_dir)
+    if sentence_audio_job is not None:
+        sentence_audio = sentence_audio_job.result()
+    else:
+        sentence_audio = generate_sentence_audio(jp_ex, media_dir)
 
     return CardData(
         term=term,
@@ -1313,6 +2069,68 @@ def gather_for_term(
     )
 
 
+def gather_for_terms(
+    terms: List[str],
+    media_dir: Path,
+    *,
+    debug: bool = False,
+    logger: Optional[Callable[[str], None]] = None,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+    on_complete: Optional[Callable[[], None]] = None,
+    full_definitions: bool = True,
+) -> List[CardData]:
+    """Run :func:`gather_for_term` for every term on a bounded thread pool.
+
+    The work is network-bound, so overlapping the per-term requests hides most of
+    the API latency. Results are returned in the same order as ``terms``;
+    ``on_complete`` is invoked from the calling thread once per finished term.
+    A term whose lookup raises is logged and kept as a bare card, so one failure
+    never aborts the rest of the batch. Each term's Tatoeba lookup and audio
+    synthesis run on a second pool so they overlap with its other lookups. Terms
+    share identical audio and image jobs for the duration of the call.
+    """
+    wikipedia_definitions = fetch_wikipedia_ja_definitions(
+        terms, debug=debug, logger=logger, max_workers=max_workers
+    )
+    wiktionary_pages: Dict[str, bool] = {}
+    if full_definitions:
+        # Lean runs decide per term (after Jisho) whether to chase fallbacks, so
+        # only full runs know up front that every uncovered term needs Wiktionary.
+        wiktionary_pages = fetch_wiktionary_ja_titles(
+            [term for term in terms if not wikipedia_definitions.get(term)],
+            debug=debug,
+            logger=logger,
+            max_workers=max_workers,
+        )
+    results: List[Optional[CardData]] = [None] * len(terms)
+    with shared_media_jobs(), ThreadPoolExecutor(max_workers=max(1, max_workers)) as side_executor:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    gather_for_term,
+                    term,
+                    media_dir,
+                    debug=debug,
+                    logger=logger,
+                    wikipedia_definition=wikipedia_definitions.get(term),
+                    side_executor=side_executor,
+                    full_definitions=full_definitions,
+                    has_wiktionary_page=wiktionary_pages.get(term),
+                ): idx
+                for idx, term in enumerate(terms)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    console.log(f"[yellow]Lookup failed for '{terms[idx]}': {e}")
+                    results[idx] = CardData(term=terms[idx])
+                if on_complete is not None:
+                    on_complete()
+    return [cd for cd in results if cd is not None]
+
+
 def save_config(
     config_path: Path, deck_id: int, model_id: int, deck_name: str, mode: InputMode
 ) -> None:
@@ -1390,31 +2208,50 @@ def run_builder(
 
     if params.mode is InputMode.VOCABULARY:
         model = build_model(model_id)
-        terms = read_csv_single_column(csv_file)
-        if not terms:
+        # Duplicate rows would produce notes with the same GUID, so only fetch once.
+        total_terms = 0
+        seen_terms: Dict[str, None] = {}
+        for term in iter_csv_single_column(csv_file):
+            total_terms += 1
+            seen_terms.setdefault(term)
+        if not total_terms:
             raise BuildError("No terms found in CSV. Exiting.", exit_code=0)
 
-        card_data_list: List[CardData] = []
+        unique_terms = list(seen_terms)
+        duplicates = total_terms - len(unique_terms)
+        if duplicates:
+            reporter.info(f"Skipping {duplicates} duplicate term(s) found in the CSV.")
 
-        reporter.progress_start(len(terms), description="Fetching data...")
+        reporter.progress_start(len(unique_terms), description="Fetching data...")
         debug_logger = reporter.debug if params.debug else None
+        cache_context = (
+            response_cache(out_dir / HTTP_CACHE_FILE) if params.use_cache else nullcontext()
+        )
         try:
-            for term in terms:
-                cd = gather_for_term(
-                    term, media_dir, debug=params.debug, logger=debug_logger
+            with cache_context, circuit_breakers() as breakers:
+                card_data_list = gather_for_terms(
+                    unique_terms,
+                    media_dir,
+                    debug=params.debug,
+                    logger=debug_logger,
+                    max_workers=params.workers,
+                    on_complete=reporter.progress_advance,
+                    full_definitions=params.full_definitions,
                 )
-                card_data_list.append(cd)
-                if cd.image_filename:
-                    media_files.append(str(media_dir / cd.image_filename))
-                if cd.audio_filename:
-                    media_files.append(str(media_dir / cd.audio_filename))
-                if cd.sentence_audio_filename:
-                    media_files.append(str(media_dir / cd.sentence_audio_filename))
-                reporter.progress_advance()
         finally:
             reporter.progress_finish()
+        for host, skipped in breakers.skipped_requests().items():
+            reporter.warning(
+                f"Skipped {skipped} request(s) to {host} after repeated failures; "
+                "some cards may be missing data from it."
+            )
 
         for cd in card_data_list:
+            media_files.extend(
+                str(media_dir / filename)
+                for filename in (cd.image_filename, cd.audio_filename, cd.sentence_audio_filename)
+                if filename
+            )
             note = make_note(model, cd)
             try:
                 deck.add_note(note)
@@ -1422,8 +2259,6 @@ def run_builder(
             except Exception as e:
                 reporter.warning(f"Skipped note for '{cd.term}': {e}")
 
-        total_terms = len(terms)
-
     else:
         model = build_grammar_model(model_id)
         grammar_cards = read_grammar_csv(csv_file)
@@ -1431,20 +2266,30 @@ def run_builder(
             raise BuildError("No grammar entries found in CSV. Exiting.", exit_code=0)
 
         reporter.progress_start(len(grammar_cards), description="Adding grammar notes...")
+        # gTTS calls are network-bound, so every distinct example is queued on a
+        # pool up front (identical sentences share one file and one request) and
+        # notes are assembled in order as their audio becomes ready.
         try:
-            for gc in grammar_cards:
-                example_audio = generate_sentence_audio(gc.example_jp, media_dir)
-                gc.example_audio_filename = example_audio
-                if example_audio:
-                    media_files.append(str(media_dir / example_audio))
-                note = make_grammar_note(model, gc)
-                try:
-                    deck.add_note(note)
-                    added += 1
-                except Exception as e:
-                    reporter.warning(f"Skipped grammar note for '{gc.question}': {e}")
-                finally:
-                    reporter.progress_advance()
+            with ThreadPoolExecutor(max_workers=max(1, params.workers)) as executor:
+                audio_jobs: Dict[str, "Future[str]"] = {}
+                for gc in grammar_cards:
+                    if gc.example_jp not in audio_jobs:
+                        audio_jobs[gc.example_jp] = executor.submit(
+                            generate_sentence_audio, gc.example_jp, media_dir
+                        )
+                for gc in grammar_cards:
+                    example_audio = audio_jobs[gc.example_jp].result()
+                    gc.example_audio_filename = example_audio
+                    if example_audio:
+                        media_files.append(str(media_dir / example_audio))
+                    note = make_grammar_note(model, gc)
+                    try:
+                        deck.add_note(note)
+                        added += 1
+                    except Exception as e:
+                        reporter.warning(f"Skipped grammar note for '{gc.question}': {e}")
+                    finally:
+                        reporter.progress_advance()
         finally:
             reporter.progress_finish()
 
@@ -1453,7 +2298,8 @@ def run_builder(
     apkg_name = f"{safe_filename(deck_name)}.apkg"
     apkg_path = out_dir / apkg_name
     validated_media_files: List[str] = []
-    for media_path_str in media_files:
+    # Terms can share an image or example-sentence audio; package each file once.
+    for media_path_str in dict.fromkeys(media_files):
         media_path = Path(media_path_str)
         if media_path.exists():
             validated_media_files.append(media_path_str)
@@ -1554,6 +2400,22 @@ def build(
         case_sensitive=False,
         help="Choose 'vocabulary' for enriched word cards or 'grammar' for explanation cards.",
     ),
+    workers: int = typer.Option(
+        DEFAULT_FETCH_WORKERS,
+        "--workers",
+        min=1,
+        help="Number of vocabulary terms to enrich concurrently.",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=f"Reuse API responses stored in {HTTP_CACHE_FILE} (--no-cache always refetches).",
+    ),
+    full_definitions: bool = typer.Option(
+        True,
+        "--full-definitions/--lean-definitions",
+        help="With --lean-definitions, skip the Wiktionary/Kotobank fallbacks for terms Jisho already lists several senses for.",
+    ),
 ):
     """Build or append an Anki deck from a CSV source of Japanese vocabulary or grammar prompts."""
     params = BuildParams(
@@ -1564,21 +2426,26 @@ def build(
         config_path=Path(config) if config else None,
         debug=debug,
         mode=mode,
+        workers=workers,
+        use_cache=use_cache,
+        full_definitions=full_definitions,
     )
-    reporter = RichBuildReporter(console)
+    debug_log_path = params.output_dir / DEBUG_LOG_FILE
     result: Optional[BuildResult] = None
     failure_message: Optional[str] = None
     exit_code = 0
-    try:
-        result = run_builder(params, reporter)
-    except BuildError as exc:
-        failure_message = str(exc)
-        exit_code = exc.exit_code
-        console.print(f"[red]{exc}")
-    except Exception as exc:
-        failure_message = f"Unexpected error: {exc}"
-        exit_code = 1
-        console.print(f"[red]Unexpected error:[/] {exc}")
+    with debug_log_file(debug_log_path) if debug else nullcontext() as debug_log:
+        reporter = RichBuildReporter(console, debug_log=debug_log)
+        try:
+            result = run_builder(params, reporter)
+        except BuildError as exc:
+            failure_message = str(exc)
+            exit_code = exc.exit_code
+            console.print(f"[red]{exc}")
+        except Exception as exc:
+            failure_message = f"Unexpected error: {exc}"
+            exit_code = 1
+            console.print(f"[red]Unexpected error:[/] {exc}")
 
     # Summary
     if not failure_message and result is not None:
@@ -1603,16 +2470,12 @@ def build(
         failure_message=failure_message,
     )
     console.print(f"[cyan]Run log saved to[/] {log_path}")
+    if debug:
+        console.print(f"[cyan]Debug log saved to[/] {debug_log_path}")
 
     if failure_message:
         raise typer.Exit(code=exit_code)
 
-    if debug:
-        log_path = params.output_dir / "anki_deck_builder_debug_log.txt"
-        log_text = console.export_text(clear=False, styles=False)
-        log_path.write_text(log_text, encoding="utf-8")
-        console.print(f"[cyan]Debug log saved to[/] {log_path}")
-
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,110 @@
+"""Per-host circuit breakers that stop calling an API after repeated failures."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Open after ``failure_threshold`` consecutive failures for ``cooldown`` seconds.
+
+    Once the cooldown has passed, requests are let through again; the next
+    failure re-opens the circuit straight away and a success closes it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and self._clock() - self._opened_at < self.cooldown
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+
+
+class HostCircuitBreaker:
+    """Keep one :class:`CircuitBreaker` per hostname, created on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._skipped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.failure_threshold, self.cooldown, clock=self._clock
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def _breaker_for_url(self, url: str) -> CircuitBreaker:
+        return self.breaker_for((urlsplit(url).hostname or "").lower())
+
+    def check(self, url: str) -> None:
+        """Raise :class:`CircuitOpenError` if ``url``'s host is currently skipped."""
+        if self._breaker_for_url(url).is_open:
+            host = urlsplit(url).hostname or url
+            with self._lock:
+                self._skipped[host] = self._skipped.get(host, 0) + 1
+            raise CircuitOpenError(
+                f"skipping {host}: too many recent failures, retrying after a cooldown"
+            )
+
+    def record(self, url: str, ok: bool) -> None:
+        breaker = self._breaker_for_url(url)
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def skipped_requests(self) -> Dict[str, int]:
+        """Return how many requests :meth:`check` refused, keyed by hostname."""
+        with self._lock:
+            return dict(self._skipped)
+
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "HostCircuitBreaker"]
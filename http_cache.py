@@ -0,0 +1,100 @@
+"""SQLite-backed cache for the GET responses returned by the public lookup APIs."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body TEXT NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+class CachedResponse:
+    """Replay of a successful response with the subset of ``requests.Response`` we use."""
+
+    status_code = 200
+
+    def __init__(self, url: str, text: str) -> None:
+        self.url = url
+        self.text = text
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Return a stable key for ``url`` + ``params`` (headers are deliberately ignored)."""
+    items = sorted((str(key), str(value)) for key, value in (params or {}).items())
+    raw = url + "?" + "&".join(f"{key}={value}" for key, value in items)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe store of response bodies keyed by request URL and parameters."""
+
+    def __init__(self, path: Path, *, ttl: float = DEFAULT_CACHE_TTL_SECONDS) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            # Every stored response is its own commit; write-ahead logging with
+            # relaxed syncing keeps those cheap and lets readers run alongside
+            # a writer. A crash can at worst drop the last few cached bodies.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Optional[str]:
+        key = cache_key(url, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, stored_at = row
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            return None
+        return body
+
+    def set(self, url: str, params: Optional[Mapping[str, Any]], body: str) -> None:
+        key = cache_key(url, params)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, body, stored_at) VALUES (?, ?, ?, ?)",
+                (key, url, body, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = [
+    "CachedResponse",
+    "DEFAULT_CACHE_TTL_SECONDS",
+    "ResponseCache",
+    "cache_key",
+]
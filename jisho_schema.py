@@ -0,0 +1,101 @@
+"""Typed view of the Jisho search API response, decoded with msgspec when available."""
+from __future__ import annotations
+
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+if importlib.util.find_spec("msgspec") is not None:
+    import msgspec
+else:  # pragma: no cover - exercised when msgspec is not installed
+    msgspec = None
+
+
+@dataclass
+class JishoForm:
+    word: Optional[str] = None
+    reading: Optional[str] = None
+
+
+@dataclass
+class JishoSense:
+    english_definitions: List[str] = field(default_factory=list)
+    parts_of_speech: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class JishoEntry:
+    japanese: List[JishoForm] = field(default_factory=list)
+    senses: List[JishoSense] = field(default_factory=list)
+
+
+@dataclass
+class JishoResponse:
+    meta: Dict[str, Any] = field(default_factory=dict)
+    data: List[JishoEntry] = field(default_factory=list)
+
+
+if msgspec is not None:
+    _DECODER = msgspec.json.Decoder(JishoResponse)
+
+
+def decode_jisho_response(content: Union[bytes, str]) -> Optional[JishoResponse]:
+    """Decode a raw Jisho body straight into ``JishoResponse``.
+
+    Unused fields (attribution, links, jlpt, ...) are skipped while parsing instead
+    of being materialised. Returns ``None`` when msgspec is unavailable or the
+    payload does not match the expected shape, so callers can fall back to
+    ``jisho_response_from_json``.
+    """
+    if msgspec is None:
+        return None
+    try:
+        return _DECODER.decode(content)
+    except (msgspec.DecodeError, TypeError):
+        return None
+
+
+def _strings(value: Any) -> List[str]:
+    return [item for item in value if isinstance(item, str)] if isinstance(value, list) else []
+
+
+def jisho_response_from_json(payload: Any) -> JishoResponse:
+    """Build a ``JishoResponse`` from an already decoded JSON payload.
+
+    Malformed parts are dropped rather than raising, matching what the msgspec
+    schema would default them to.
+    """
+    if not isinstance(payload, dict):
+        return JishoResponse()
+    entries: List[JishoEntry] = []
+    for raw_entry in payload.get("data") or []:
+        if not isinstance(raw_entry, dict):
+            continue
+        forms = [
+            JishoForm(word=form.get("word"), reading=form.get("reading"))
+            for form in raw_entry.get("japanese") or []
+            if isinstance(form, dict)
+        ]
+        senses = [
+            JishoSense(
+                english_definitions=_strings(sense.get("english_definitions")),
+                parts_of_speech=_strings(sense.get("parts_of_speech")),
+                tags=_strings(sense.get("tags")),
+            )
+            for sense in raw_entry.get("senses") or []
+            if isinstance(sense, dict)
+        ]
+        entries.append(JishoEntry(japanese=forms, senses=senses))
+    meta = payload.get("meta")
+    return JishoResponse(meta=meta if isinstance(meta, dict) else {}, data=entries)
+
+
+__all__ = [
+    "JishoEntry",
+    "JishoForm",
+    "JishoResponse",
+    "JishoSense",
+    "decode_jisho_response",
+    "jisho_response_from_json",
+]
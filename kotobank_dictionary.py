@@ -1,11 +1,22 @@
 """Helpers to parse monolingual definitions from the Kotobank Japanese dictionary."""
 from __future__ import annotations
 
+import importlib.util
 import json
 import re
 from html import unescape
 from typing import Any, Iterator
 
+if importlib.util.find_spec("selectolax") is not None:
+    from selectolax.lexbor import LexborHTMLParser
+else:  # pragma: no cover - exercised when the optional parser is missing
+    LexborHTMLParser = None
+
+if importlib.util.find_spec("orjson") is not None:
+    from orjson import loads as _json_loads
+else:  # pragma: no cover - exercised when the optional decoder is missing
+    _json_loads = json.loads
+
 _JSON_LD_RE = re.compile(
     r"<script[^>]+type=['\"]application/ld\+json['\"][^>]*>(.*?)</script>",
     re.IGNORECASE | re.DOTALL,
@@ -16,11 +27,30 @@ _HTML_BLOCK_RE = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+_BLOCK_TAGS_SELECTOR = "section, div, p, dd, li"
+
+# A matched node's content as _HTML_BLOCK_RE sees it: from the end of its opening
+# tag up to the first closing block tag, which may belong to a nested child.
+_NODE_BLOCK_CONTENT_RE = re.compile(
+    r"^<[^>]*>(.*?)</(?:section|div|p|dd|li)>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_BLOCK_ATTR_RE = re.compile(
+    r"(?:meaning|description|content|text|kiji|entry|body|def|definition)$",
+    re.IGNORECASE,
+)
+
 _META_DESC_RE = re.compile(
     r"<meta[^>]+name=['\"]description['\"][^>]+content=['\"](.*?)['\"]",
     re.IGNORECASE | re.DOTALL,
 )
 
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_INLINE_WS_RE = re.compile(r"[\t\x0b\f]+")
+
 _DICTIONARY_TYPES = {"DefinedTerm", "DictionaryEntry", "Article", "Sense"}
 
 _NOISE_SNIPPETS = (
@@ -45,14 +75,18 @@ def extract_first_kotobank_definition(html: str) -> str:
 def _extract_first_definition_from_json_ld(html: str) -> str:
     for block in _JSON_LD_RE.findall(html or ""):
         block = block.strip()
-        if not block:
+        # Breadcrumb/organisation blocks carry no descriptions; don't parse them.
+        if '"description"' not in block:
             continue
         try:
-            data = json.loads(block)
-        except json.JSONDecodeError:
+            data = _json_loads(block)
+        except ValueError:  # json and orjson decode errors both subclass it
             continue
         fallback: str = ""
         for description, priority in _iter_json_descriptions(data):
+            if priority and fallback:
+                # Only a dictionary-typed description can still beat the fallback.
+                continue
             cleaned = _clean_text(description)
             if not cleaned or _is_noise_definition(cleaned):
                 continue
@@ -60,27 +94,35 @@ def _extract_first_definition_from_json_ld(html: str) -> str:
                 return cleaned
             if not fallback:
                 fallback = cleaned
-        if fallback and not _is_noise_definition(fallback):
+        if fallback:
             return fallback
     return ""
 
 
-def _iter_json_descriptions(obj: Any) -> Iterator[tuple[str, int]]:
-    if isinstance(obj, dict):
-        value = obj.get("description")
-        if isinstance(value, str):
-            typ = obj.get("@type")
-            priority = 0 if isinstance(typ, str) and typ in _DICTIONARY_TYPES else 1
-            yield value, priority
-        for child in obj.values():
-            yield from _iter_json_descriptions(child)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from _iter_json_descriptions(item)
+def _iter_json_descriptions(root: Any) -> Iterator[tuple[str, int]]:
+    """Yield ``(description, priority)`` pairs in document (depth-first) order.
+
+    Walks an explicit stack instead of recursing, so deeply nested JSON-LD does
+    not build a chain of nested generators.
+    """
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            value = obj.get("description")
+            if isinstance(value, str):
+                typ = obj.get("@type")
+                priority = 0 if isinstance(typ, str) and typ in _DICTIONARY_TYPES else 1
+                yield value, priority
+            stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
 
 
 def _extract_first_definition_from_html_blocks(html: str) -> str:
-    cleaned_html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
+    if LexborHTMLParser is not None:
+        return _extract_first_definition_with_parser(html)
+    cleaned_html = _COMMENT_RE.sub("", html)
     for block in _HTML_BLOCK_RE.findall(cleaned_html):
         cleaned = _clean_html_fragment(block)
         if cleaned and not _is_noise_definition(cleaned):
@@ -93,20 +135,46 @@ def _extract_first_definition_from_html_blocks(html: str) -> str:
     return ""
 
 
+def _extract_first_definition_with_parser(html: str) -> str:
+    """Same lookup as the regex path, but walks a lexbor DOM instead of backtracking.
+
+    Each matching node's text is cut where ``_HTML_BLOCK_RE`` would stop (the
+    first closing block tag), so trailing siblings such as ads or related-entry
+    boxes are left out exactly as on the regex path.
+    """
+    tree = LexborHTMLParser(html)
+    for node in tree.css(_BLOCK_TAGS_SELECTOR):
+        attributes = node.attributes
+        if not any(
+            _BLOCK_ATTR_RE.search(attributes.get(name) or "")
+            for name in ("class", "itemprop")
+        ):
+            continue
+        content = _NODE_BLOCK_CONTENT_RE.match(_COMMENT_RE.sub("", node.html or ""))
+        cleaned = _clean_html_fragment(content.group(1)) if content else ""
+        if cleaned and not _is_noise_definition(cleaned):
+            return cleaned
+    meta = tree.css_first('meta[name="description"]')
+    if meta is not None:
+        cleaned_meta = _clean_text(meta.attributes.get("content") or "")
+        if cleaned_meta and not _is_noise_definition(cleaned_meta):
+            return cleaned_meta
+    return ""
+
+
 def _clean_html_fragment(fragment: str) -> str:
-    fragment = re.sub(r"<br\s*/?>", "\n", fragment, flags=re.IGNORECASE)
-    fragment = re.sub(r"</?(?:rt|rp)>", "", fragment, flags=re.IGNORECASE)
-    fragment = re.sub(r"<[^>]+>", "", fragment)
+    # <rt>/<rp> tags are ordinary tags to _TAG_RE, so two passes cover all three cases.
+    fragment = _BR_RE.sub("\n", fragment)
+    fragment = _TAG_RE.sub("", fragment)
     return _clean_text(fragment)
 
 
 def _clean_text(text: str) -> str:
-    text = unescape(text or "")
-    text = re.sub(r"\r\n?|\r", "\n", text)
-    text = re.sub(r"[\t\x0b\f]+", " ", text)
-    lines = [line.strip() for line in text.split("\n")]
-    filtered = [line for line in lines if line]
-    return " ".join(filtered).strip()
+    if not text:
+        return ""
+    text = _INLINE_WS_RE.sub(" ", unescape(text))
+    # splitlines() covers \r\n, \r and \n in the same pass that splits the text.
+    return " ".join(filter(None, map(str.strip, text.splitlines())))
 
 
 def _is_noise_definition(text: str) -> bool:
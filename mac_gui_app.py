@@ -17,6 +17,10 @@ from anki_deck_builder import (
     run_builder,
 )
 
+# Progress advances from the worker are coalesced into at most one UI update
+# per this many milliseconds instead of one Tk callback per term.
+PROGRESS_FLUSH_MS = 50
+
 
 class TkBuildReporter(NullBuildReporter):
     """Report build progress to the Tkinter UI."""
@@ -36,6 +40,8 @@ class TkBuildReporter(NullBuildReporter):
         self._start_time: float | None = None
         self._completed = 0
         self._total = 0
+        self._progress_lock = threading.Lock()
+        self._flush_scheduled = False
 
     def _dispatch(self, func, *args) -> None:
         self.root.after(0, lambda: func(*args))
@@ -96,14 +102,26 @@ class TkBuildReporter(NullBuildReporter):
         self._dispatch(setup)
 
     def progress_advance(self, advance: int = 1) -> None:
-        self._completed += advance
-        if self._total:
-            self._completed = min(self._completed, self._total)
+        with self._progress_lock:
+            self._completed += advance
+            if self._total:
+                self._completed = min(self._completed, self._total)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        # Runs on the Tk thread; picks up every advance made since it was scheduled.
+        with self._progress_lock:
+            self._flush_scheduled = False
+            completed = self._completed
+        self.progress["value"] = completed
         self._schedule_time_update()
-        self._dispatch(self.progress.step, advance)
 
     def progress_finish(self) -> None:
-        self._completed = self._total
+        with self._progress_lock:
+            self._completed = self._total
         self._schedule_time_update()
 
         def finish() -> None:
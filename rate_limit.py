@@ -0,0 +1,115 @@
+"""Thread-safe per-host token buckets and concurrency caps for outgoing API requests."""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second with bursts of up to ``capacity``."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+
+class HostRateLimiter:
+    """Keep one :class:`TokenBucket` per hostname, created on first use."""
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        default_rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rates = dict(rates)
+        self.default_rate = default_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate = self.rates.get(host, self.default_rate)
+                bucket = TokenBucket(rate, clock=self._clock, sleep=self._sleep)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to ``url``'s host fits within its rate."""
+        host = (urlsplit(url).hostname or "").lower()
+        self.bucket_for(host).acquire()
+
+
+class HostConcurrencyLimiter:
+    """Cap how many requests may be in flight to each hostname at once.
+
+    The token buckets only pace how often requests start; slow responses can
+    still pile up many open connections to one host. Each hostname gets a
+    semaphore sized from ``limits`` (or ``default_limit``) on first use.
+    """
+
+    def __init__(self, limits: Mapping[str, int], default_limit: int) -> None:
+        self.limits = dict(limits)
+        self.default_limit = default_limit
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def semaphore_for(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                limit = self.limits.get(host, self.default_limit)
+                if limit < 1:
+                    raise ValueError(f"concurrency limit for {host!r} must be at least 1")
+                semaphore = threading.BoundedSemaphore(limit)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold one of ``url``'s host slots for the duration of the block."""
+        host = (urlsplit(url).hostname or "").lower()
+        with self.semaphore_for(host):
+            yield
+
+
+__all__ = ["HostConcurrencyLimiter", "HostRateLimiter", "TokenBucket"]
@@ -1,7 +1,35 @@
 import sys
+import types
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests off the network and don't pace stub sessions like real hosts.
+
+    Tests that exercise a fetcher patch ``_get_session`` themselves; anything else
+    that reaches for the network fails fast and takes the fetchers' error path.
+    """
+    builder = sys.modules.get("anki_deck_builder")
+    if builder is None or not hasattr(builder, "_rate_limiter"):
+        return
+    from circuit_breaker import HostCircuitBreaker
+    from rate_limit import HostRateLimiter
+
+    def _offline_get(url, *args, **kwargs):
+        raise RuntimeError(f"network access disabled in tests: {url}")
+
+    monkeypatch.setattr(
+        builder, "_rate_limiter", HostRateLimiter({}, 1e9)
+    )
+    monkeypatch.setattr(builder, "_circuit_breaker", HostCircuitBreaker())
+    monkeypatch.setattr(
+        builder, "_get_session", lambda: types.SimpleNamespace(get=_offline_get)
+    )
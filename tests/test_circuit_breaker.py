@@ -0,0 +1,134 @@
+import types
+
+import pytest
+import requests
+
+import anki_deck_builder as builder
+from circuit_breaker import CircuitBreaker, CircuitOpenError, HostCircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_consecutive_failures_and_recovers() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now = 60
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now = 200
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+def test_host_breaker_isolates_hosts() -> None:
+    breakers = HostCircuitBreaker(failure_threshold=1, cooldown=60, clock=FakeClock())
+    breakers.record("https://ja.wikipedia.org/w/api.php", ok=False)
+
+    with pytest.raises(CircuitOpenError):
+        breakers.check("https://ja.wikipedia.org/w/api.php?action=query")
+    breakers.check("https://ja.wiktionary.org/w/api.php")
+
+
+def test_http_get_fails_fast_once_a_host_keeps_timing_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        raise requests.Timeout("timed out")
+
+    monkeypatch.setattr(builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
+    monkeypatch.setattr(builder, "_circuit_breaker", HostCircuitBreaker(failure_threshold=2))
+
+    for _ in range(2):
+        with pytest.raises(requests.Timeout):
+            builder._http_get(builder.JISHO_URL, use_cache=False)
+    with pytest.raises(CircuitOpenError):
+        builder._http_get(builder.JISHO_URL, use_cache=False)
+
+    assert len(calls) == 2
+    assert builder.fetch_jisho("猫") == ("", "")
+    assert len(calls) == 2
+
+
+def test_each_build_starts_with_fresh_breakers_and_reports_skips(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        raise requests.Timeout("timed out")
+
+    def fake_gather_for_term(term, media_dir, **kwargs):
+        try:
+            builder._http_get(builder.JISHO_URL, use_cache=False)
+        except (requests.Timeout, CircuitOpenError):
+            pass
+        return builder.CardData(term=term)
+
+    class CollectingReporter(builder.NullBuildReporter):
+        def __init__(self) -> None:
+            self.warnings = []
+
+        def warning(self, message: str) -> None:
+            self.warnings.append(message)
+
+    monkeypatch.setattr(builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
+    monkeypatch.setattr(builder, "gather_for_term", fake_gather_for_term)
+    csv_path = tmp_path / "vocab.csv"
+    csv_path.write_text("一\n二\n三\n四\n五\n", encoding="utf-8")
+    params = builder.BuildParams(
+        csv_path=csv_path,
+        output_dir=tmp_path / "out",
+        new_deck=True,
+        deck_name="Test Deck",
+        config_path=None,
+        debug=False,
+        mode=builder.InputMode.VOCABULARY,
+        workers=1,
+        use_cache=False,
+    )
+
+    for _ in range(2):
+        reporter = CollectingReporter()
+        builder.run_builder(params, reporter)
+        jisho_calls = [url for url in calls if url == builder.JISHO_URL]
+        assert len(jisho_calls) == builder.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        assert reporter.warnings == [
+            "Skipped 2 request(s) to jisho.org after repeated failures; "
+            "some cards may be missing data from it."
+        ]
+        calls.clear()
+
+
+def test_retry_policy_caps_retry_after_and_survives_increment() -> None:
+    from urllib3.response import HTTPResponse
+
+    retry = builder._build_retry()
+    response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+
+    assert retry.get_retry_after(response) == builder.MAX_RETRY_AFTER_SECONDS
+    retried = retry.increment(method="GET", url="/", response=response)
+    assert retried.get_retry_after(response) == builder.MAX_RETRY_AFTER_SECONDS
+    assert 0 <= retried.get_backoff_time() <= 0.3 * 1.5
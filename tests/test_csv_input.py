@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from anki_deck_builder import iter_csv_single_column, read_csv_single_column
+
+
+def test_read_csv_single_column_plain_terms(tmp_path: Path) -> None:
+    csv_path = tmp_path / "terms.csv"
+    csv_path.write_text("﻿猫\n\n犬;\n 食べる ,taberu\n", encoding="utf-8")
+
+    assert read_csv_single_column(csv_path) == ["猫", "犬", "食べる"]
+
+
+def test_read_csv_single_column_quoted_cells(tmp_path: Path) -> None:
+    csv_path = tmp_path / "quoted.csv"
+    csv_path.write_text(
+        '"猫, ねこ",cat\n"犬",dog\n"食べる",to eat\n', encoding="utf-8"
+    )
+
+    assert read_csv_single_column(csv_path) == ["猫, ねこ", "犬", "食べる"]
+
+
+def test_read_csv_single_column_streams_past_sample(tmp_path: Path) -> None:
+    terms = [f"語{i}" for i in range(3000)]
+    csv_path = tmp_path / "large.csv"
+    csv_path.write_text("\n".join(terms) + "\n", encoding="utf-8")
+
+    assert read_csv_single_column(csv_path) == terms
+
+
+def test_read_csv_single_column_quoted_semicolon_cells(tmp_path: Path) -> None:
+    csv_path = tmp_path / "semicolon.csv"
+    csv_path.write_text('"猫, ねこ";cat\n"犬";dog\n', encoding="utf-8")
+
+    assert read_csv_single_column(csv_path) == ["猫, ねこ", "犬"]
+
+
+def test_iter_csv_single_column_is_lazy(tmp_path: Path) -> None:
+    csv_path = tmp_path / "terms.csv"
+    csv_path.write_text("猫\n犬\n", encoding="utf-8")
+
+    rows = iter_csv_single_column(csv_path)
+
+    assert next(rows) == "猫"
+    assert list(rows) == ["犬"]
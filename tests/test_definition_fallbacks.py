@@ -170,8 +170,8 @@ class DummyResponse:
 def _patch_common_fetchers(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         adb,
-        "fetch_jisho",
-        lambda term, debug=False, logger=None: ("よみ", "english"),
+        "fetch_jisho_entry",
+        lambda term, debug=False, logger=None: ("よみ", "english", 1),
     )
     monkeypatch.setattr(
         adb,
@@ -200,7 +200,7 @@ def test_fetch_wiktionary_ja_definition_parses_extract(monkeypatch: pytest.Monke
         assert params["titles"] == term
         return DummyResponse(payload)
 
-    monkeypatch.setattr(adb.requests, "get", fake_get)
+    monkeypatch.setattr(adb, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
 
     definition = adb.fetch_wiktionary_ja_definition(term)
     assert definition == "試験などを意味する言葉。"
@@ -312,3 +312,131 @@ def test_gather_for_term_falls_back_to_kotobank(monkeypatch: pytest.MonkeyPatch,
 
     assert card.definition_ja == "Kotobank"
     assert calls == {"wikipedia": 1, "wiktionary": 1, "kotobank": 1}
+
+
+def test_fetch_wikipedia_ja_definitions_batches_and_maps_redirects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = {
+        "query": {
+            "normalized": [{"from": "ねこ", "to": "ねこ"}],
+            "redirects": [{"from": "ねこ", "to": "ネコ"}],
+            "pages": {
+                "1": {"pageid": 1, "title": "ネコ", "extract": "ネコは哺乳類である。詳細は後述。"},
+                "-1": {"title": "存在しない語", "missing": ""},
+                "2": {"pageid": 2, "title": "犬"},
+            },
+        }
+    }
+    requested = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        assert url == adb.WIKIPEDIA_JA_API
+        requested.append(params["titles"])
+        return DummyResponse(payload)
+
+    monkeypatch.setattr(adb, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
+
+    definitions = adb.fetch_wikipedia_ja_definitions(["ねこ", "存在しない語", "犬", "ねこ"])
+
+    assert requested == ["ねこ|存在しない語|犬"]
+    assert definitions == {"ねこ": "ネコは哺乳類である。", "存在しない語": ""}
+
+
+def test_fetch_wiktionary_ja_titles_reports_missing_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = {
+        "query": {
+            "redirects": [{"from": "ねこ", "to": "猫"}],
+            "pages": {
+                "1": {"pageid": 1, "title": "猫"},
+                "-1": {"title": "存在しない語", "missing": ""},
+            },
+        }
+    }
+    requested = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        assert url == adb.WIKTIONARY_JA_API
+        requested.append(params["titles"])
+        return DummyResponse(payload)
+
+    monkeypatch.setattr(adb, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
+
+    pages = adb.fetch_wiktionary_ja_titles(["ねこ", "存在しない語", "ねこ"])
+
+    assert requested == ["ねこ|存在しない語"]
+    assert pages == {"ねこ": True, "存在しない語": False}
+
+
+def test_gather_for_term_skips_wiktionary_without_a_page(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    _patch_common_fetchers(monkeypatch)
+
+    def _fail(term, debug=False, logger=None):  # pragma: no cover - must not run
+        raise AssertionError("Wiktionary has no page for this term")
+
+    monkeypatch.setattr(adb, "fetch_wiktionary_ja_definition", _fail)
+    monkeypatch.setattr(
+        adb, "fetch_kotobank_ja_definition", lambda term, debug=False, logger=None: "Kotobank"
+    )
+
+    card = adb.gather_for_term(
+        "語", tmp_path, wikipedia_definition="", has_wiktionary_page=False
+    )
+
+    assert card.definition_ja == "Kotobank"
+
+
+def test_gather_for_term_uses_prefetched_wikipedia_definition(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    _patch_common_fetchers(monkeypatch)
+
+    def _fail(term, debug=False, logger=None):  # pragma: no cover - must not run
+        raise AssertionError("prefetched definition should be used")
+
+    monkeypatch.setattr(adb, "fetch_wikipedia_ja_definition", _fail)
+    monkeypatch.setattr(
+        adb, "fetch_wiktionary_ja_definition", lambda term, debug=False, logger=None: "Wiktionary"
+    )
+
+    card = adb.gather_for_term("語", tmp_path, wikipedia_definition="")
+
+    assert card.definition_ja == "Wiktionary"
+
+
+@pytest.mark.parametrize(
+    ("english", "sense_count", "expected"),
+    [
+        ("cat; feline", 2, ""),
+        ("cat", 1, "Wiktionary"),
+        # One sense whose definitions contain "and" or commas is still a single sense.
+        ("rock and roll, rock 'n' roll", 1, "Wiktionary"),
+    ],
+)
+def test_gather_for_term_lean_definitions_trusts_rich_jisho_gloss(
+    monkeypatch: pytest.MonkeyPatch, tmp_path, english: str, sense_count: int, expected: str
+) -> None:
+    _patch_common_fetchers(monkeypatch)
+    monkeypatch.setattr(
+        adb,
+        "fetch_jisho_entry",
+        lambda term, debug=False, logger=None: ("ねこ", english, sense_count),
+    )
+    monkeypatch.setattr(adb, "generate_term_audio", lambda term, reading, media_dir: "")
+    monkeypatch.setattr(adb, "generate_sentence_audio", lambda sentence, media_dir: "")
+    monkeypatch.setattr(
+        adb, "fetch_wiktionary_ja_definition", lambda term, debug=False, logger=None: "Wiktionary"
+    )
+    monkeypatch.setattr(
+        adb, "fetch_kotobank_ja_definition", lambda term, debug=False, logger=None: "Kotobank"
+    )
+
+    lean = adb.gather_for_term("猫", tmp_path, wikipedia_definition="", full_definitions=False)
+    full = adb.gather_for_term("猫", tmp_path, wikipedia_definition="")
+
+    assert lean.definition_ja == expected
+    assert full.definition_ja == "Wiktionary"
@@ -0,0 +1,147 @@
+import io
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import anki_deck_builder as builder
+
+
+class DummyResponse:
+    def __init__(
+        self,
+        *,
+        text: str = "",
+        payload: Any = None,
+        body: bytes = b"",
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.text = text
+        self._payload = payload
+        self.raw = io.BytesIO(body)
+        self.status_code = status
+        self.headers = headers or {}
+
+    def json(self) -> Any:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def __enter__(self) -> "DummyResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> bool:
+        return False
+
+
+def _install_session(
+    monkeypatch: pytest.MonkeyPatch,
+    results: List[Dict[str, str]],
+    images: Dict[str, DummyResponse],
+    calls: List[str],
+) -> None:
+    def fake_get(url, params=None, headers=None, timeout=None, stream=False):
+        calls.append(url)
+        if url == builder.DUCKDUCKGO_BASE:
+            return DummyResponse(text="vqd='4-1234'")
+        if url.endswith("i.js"):
+            return DummyResponse(payload={"results": results})
+        return images[url]
+
+    monkeypatch.setattr(
+        builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get)
+    )
+
+
+def test_fetch_duckduckgo_image_tries_next_result(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls: List[str] = []
+    results = [
+        {"thumbnail": "https://img.test/blocked.jpg"},
+        {"image": "https://img.test/full.png", "thumbnail": "https://img.test/thumb.png"},
+    ]
+    images = {
+        "https://img.test/blocked.jpg": DummyResponse(status=403),
+        "https://img.test/thumb.png": DummyResponse(body=b"png-bytes"),
+    }
+    _install_session(monkeypatch, results, images, calls)
+
+    filename = builder.fetch_duckduckgo_image("cat", tmp_path)
+
+    assert filename == "cat_img.png"
+    assert (tmp_path / filename).read_bytes() == b"png-bytes"
+    assert not (tmp_path / "cat_img.jpg").exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cat_img.png"]
+    assert calls.count(builder.DUCKDUCKGO_BASE) == 1
+
+
+def test_fetch_duckduckgo_image_reuses_existing_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    (tmp_path / "cat_img.png").write_bytes(b"cached")
+    calls: List[str] = []
+    _install_session(monkeypatch, [], {}, calls)
+
+    assert builder.fetch_duckduckgo_image("cat", tmp_path) == "cat_img.png"
+    assert calls == []
+
+
+def test_fetch_duckduckgo_image_skips_oversized_images(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(builder, "MAX_IMAGE_BYTES", 8)
+    calls: List[str] = []
+    results = [
+        {"thumbnail": "https://img.test/declared.jpg"},
+        {"thumbnail": "https://img.test/streamed.jpg"},
+        {"thumbnail": "https://img.test/small.gif"},
+    ]
+    images = {
+        "https://img.test/declared.jpg": DummyResponse(
+            body=b"x" * 20, headers={"Content-Length": "20"}
+        ),
+        "https://img.test/streamed.jpg": DummyResponse(body=b"x" * 20),
+        "https://img.test/small.gif": DummyResponse(body=b"gif"),
+    }
+    _install_session(monkeypatch, results, images, calls)
+
+    assert builder.fetch_duckduckgo_image("cat", tmp_path) == "cat_img.gif"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cat_img.gif"]
+
+
+def test_fetch_duckduckgo_image_shares_concurrent_downloads(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls: List[str] = []
+    searching = threading.Event()
+    release = threading.Event()
+
+    def fake_get(url, params=None, headers=None, timeout=None, stream=False):
+        calls.append(url)
+        if url == builder.DUCKDUCKGO_BASE:
+            searching.set()
+            release.wait(timeout=5)
+            return DummyResponse(text="vqd='4-1234'")
+        if url.endswith("i.js"):
+            return DummyResponse(payload={"results": [{"thumbnail": "https://img.test/cat.png"}]})
+        return DummyResponse(body=b"png-bytes")
+
+    monkeypatch.setattr(
+        builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get)
+    )
+
+    with builder.shared_media_jobs(), ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(builder.fetch_duckduckgo_image, "cat", tmp_path)
+        assert searching.wait(timeout=5)
+        second = pool.submit(builder.fetch_duckduckgo_image, "cat", tmp_path)
+        release.set()
+        assert first.result() == second.result() == "cat_img.png"
+
+    assert calls.count(builder.DUCKDUCKGO_BASE) == 1
@@ -50,6 +50,21 @@ def test_read_grammar_csv_handles_multiword_cells(tmp_path: Path) -> None:
     assert row.example_en == "Translation"
 
 
+def test_read_grammar_csv_reads_rows_beyond_the_sniff_sample(tmp_path: Path) -> None:
+    rows = [f"質問{i};説明{i};例文{i};Example {i}" for i in range(400)]
+    csv_path = tmp_path / "grammar.csv"
+    csv_path.write_text(
+        "question;explanation;example_jp;example_en\n" + "\n".join(rows) + "\n",
+        encoding="utf-8",
+    )
+
+    entries = read_grammar_csv(csv_path)
+
+    assert len(entries) == 400
+    assert entries[-1].question == "質問399"
+    assert entries[-1].example_en == "Example 399"
+
+
 def test_run_builder_grammar_mode_skips_network(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     csv_path = tmp_path / "grammar_cards.csv"
     csv_path.write_text(
@@ -66,6 +81,7 @@ def test_run_builder_grammar_mode_skips_network(tmp_path: Path, monkeypatch: pyt
 
     for name in [
         "fetch_jisho",
+        "fetch_jisho_entry",
         "fetch_tatoeba_example",
         "fetch_wikipedia_ja_definition",
         "fetch_wiktionary_ja_definition",
@@ -151,3 +167,60 @@ def test_run_builder_rejects_mismatched_config(tmp_path: Path) -> None:
         run_builder(params)
 
     assert "mode mismatch" in str(excinfo.value).lower()
+
+
+def test_run_builder_grammar_mode_synthesizes_shared_examples_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "grammar_cards.csv"
+    csv_path.write_text(
+        "question,explanation,example_jp,example_en\n"
+        "〜ている,Progressive aspect,音楽を聞いている,Listening to music\n"
+        "〜ている (2),Ongoing state,音楽を聞いている,Listening to music\n"
+        "〜たい,Desire,水が飲みたい,I want to drink water\n",
+        encoding="utf-8",
+    )
+
+    import anki_deck_builder as builder
+
+    synthesized: list[str] = []
+
+    def _fake_generate_sentence_audio(sentence: str, media_dir: Path) -> str:
+        synthesized.append(sentence)
+        filename = f"audio_{len(sentence)}.mp3"
+        (media_dir / filename).write_bytes(b"audio")
+        return filename
+
+    monkeypatch.setattr(builder, "generate_sentence_audio", _fake_generate_sentence_audio)
+    monkeypatch.setattr(
+        builder.genanki.Package, "write_to_file", lambda self, path: Path(path).write_bytes(b"")
+    )
+
+    params = BuildParams(
+        csv_path=csv_path,
+        output_dir=tmp_path / "out",
+        new_deck=True,
+        deck_name="Grammar Deck",
+        mode=InputMode.GRAMMAR,
+        workers=4,
+    )
+    result = run_builder(params)
+
+    assert sorted(synthesized) == sorted(["音楽を聞いている", "水が飲みたい"])
+    assert result.notes_added == 3
+
+
+def test_read_grammar_csv_probes_delimiter_despite_commas_in_cells(tmp_path: Path) -> None:
+    csv_path = tmp_path / "grammar_semicolon.csv"
+    csv_path.write_text(
+        "Question;Explanation;Example JP;Example EN\n"
+        "What is でも?;Means 'but', or 'even';雨でも行く;I'll go, even if it rains\n"
+        "What is から?;Reason, cause;暑いから;Because it's hot\n",
+        encoding="utf-8",
+    )
+
+    rows = read_grammar_csv(csv_path)
+
+    assert [row.question for row in rows] == ["What is でも?", "What is から?"]
+    assert rows[0].explanation == "Means 'but', or 'even'"
+    assert rows[0].example_en == "I'll go, even if it rains"
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import types
+
+import pytest
+
+import anki_deck_builder as builder
+from http_cache import CachedResponse, ResponseCache, cache_key
+
+
+def test_cache_key_ignores_parameter_order() -> None:
+    assert cache_key("https://example.org", {"a": 1, "b": "x"}) == cache_key(
+        "https://example.org", {"b": "x", "a": 1}
+    )
+    assert cache_key("https://example.org", {"a": 1}) != cache_key(
+        "https://example.org", {"a": 2}
+    )
+
+
+def test_response_cache_round_trip_and_expiry(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    cache.set("https://example.org", {"q": "猫"}, '{"ok": true}')
+    assert cache.get("https://example.org", {"q": "猫"}) == '{"ok": true}'
+    assert cache.get("https://example.org", {"q": "犬"}) is None
+
+    cache.ttl = -1
+    assert cache.get("https://example.org", {"q": "猫"}) is None
+    cache.close()
+
+
+def test_response_cache_uses_write_ahead_log(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    (mode,) = cache._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+    cache.close()
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+def test_http_get_replays_cached_responses(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(url)
+        return _Response('{"data": []}')
+
+    monkeypatch.setattr(
+        builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get)
+    )
+
+    with builder.response_cache(tmp_path / "cache.sqlite"):
+        first = builder._http_get("https://example.org/api", params={"keyword": "猫"})
+        second = builder._http_get("https://example.org/api", params={"keyword": "猫"})
+        uncached = builder._http_get(
+            "https://example.org/api", params={"keyword": "猫"}, use_cache=False
+        )
+
+    assert first.text == second.text == uncached.text
+    assert second.json() == {"data": []}
+    assert calls == ["https://example.org/api", "https://example.org/api"]
+
+
+def test_response_json_decodes_cached_body() -> None:
+    response = CachedResponse("https://example.org/api", '{"data": ["猫"]}')
+
+    assert builder._response_json(response) == {"data": ["猫"]}
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_run_builder_respects_use_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_cache: bool
+) -> None:
+    csv_path = tmp_path / "vocab.csv"
+    csv_path.write_text("猫\n", encoding="utf-8")
+    active_caches: list[object] = []
+
+    def _fake_gather_for_term(term: str, media_dir: Path, **_: object) -> builder.CardData:
+        active_caches.append(builder._response_cache)
+        return builder.CardData(term=term)
+
+    monkeypatch.setattr(builder, "gather_for_term", _fake_gather_for_term)
+    monkeypatch.setattr(
+        builder.genanki.Package, "write_to_file", lambda self, path: Path(path).write_bytes(b"")
+    )
+
+    out_dir = tmp_path / "out"
+    builder.run_builder(
+        builder.BuildParams(
+            csv_path=csv_path,
+            output_dir=out_dir,
+            new_deck=True,
+            use_cache=use_cache,
+        )
+    )
+
+    assert (active_caches[0] is not None) is use_cache
+    assert (out_dir / builder.HTTP_CACHE_FILE).exists() is use_cache
@@ -0,0 +1,163 @@
+import json
+import types
+from typing import Any, Dict
+
+import pytest
+
+import anki_deck_builder as builder
+import jisho_schema
+
+
+class DummyResponse:
+    def __init__(self, payload: Dict[str, Any]):
+        self._payload = payload
+        self.text = json.dumps(payload, ensure_ascii=False)
+        self.content = self.text.encode("utf-8")
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def _install_payload(monkeypatch: pytest.MonkeyPatch, payload: Dict[str, Any]) -> None:
+    def fake_get(url, params=None, headers=None, timeout=None):
+        assert url == builder.JISHO_URL
+        return DummyResponse(payload)
+
+    monkeypatch.setattr(
+        builder, "_get_session", lambda: types.SimpleNamespace(get=fake_get)
+    )
+
+
+def test_fetch_jisho_prefers_exact_written_form(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {
+        "data": [
+            {
+                "japanese": [{"word": "日本", "reading": "にほん"}],
+                "senses": [{"english_definitions": ["Japan"]}],
+            },
+            {
+                "japanese": [{"word": "日", "reading": "ひ"}],
+                "senses": [{"english_definitions": ["sun", "day"]}],
+            },
+        ]
+    }
+    _install_payload(monkeypatch, payload)
+
+    assert builder.fetch_jisho("日") == ("ひ", "sun; day")
+
+
+def test_fetch_jisho_falls_back_to_first_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {
+        "data": [
+            {
+                "japanese": [{"word": "食べる", "reading": "たべる"}],
+                "senses": [{"english_definitions": ["to eat"]}],
+            }
+        ]
+    }
+    _install_payload(monkeypatch, payload)
+
+    assert builder.fetch_jisho("食べた") == ("たべる", "to eat")
+
+
+@pytest.mark.parametrize(
+    "decoder",
+    [
+        "stdlib",
+        pytest.param(
+            "msgspec",
+            marks=pytest.mark.skipif(
+                jisho_schema.msgspec is None, reason="msgspec is not installed"
+            ),
+        ),
+    ],
+)
+def test_fetch_jisho_keeps_gloss_without_japanese_forms(
+    monkeypatch: pytest.MonkeyPatch, decoder: str
+) -> None:
+    if decoder == "stdlib":
+        monkeypatch.setattr(builder, "decode_jisho_response", lambda content: None)
+    _install_payload(
+        monkeypatch, {"data": [{"senses": [{"english_definitions": ["dog"]}]}]}
+    )
+
+    assert builder.fetch_jisho("犬") == ("", "dog")
+
+
+def test_fetch_jisho_entry_counts_senses_not_gloss_fragments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = {
+        "data": [
+            {
+                "japanese": [{"word": "往来", "reading": "おうらい"}],
+                "senses": [
+                    {"english_definitions": ["to come and go", "coming, going"]},
+                    {"english_definitions": []},
+                ],
+            }
+        ]
+    }
+    _install_payload(monkeypatch, payload)
+
+    assert builder.fetch_jisho_entry("往来") == (
+        "おうらい",
+        "to come and go; coming, going",
+        1,
+    )
+
+
+@pytest.mark.skipif(jisho_schema.msgspec is None, reason="msgspec is not installed")
+def test_decode_jisho_response_keeps_only_used_fields() -> None:
+    raw = json.dumps(
+        {
+            "meta": {"status": 200},
+            "data": [
+                {
+                    "slug": "猫",
+                    "jlpt": ["jlpt-n5"],
+                    "japanese": [{"word": "猫", "reading": "ねこ"}],
+                    "senses": [{"english_definitions": ["cat"], "links": []}],
+                }
+            ],
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    decoded = jisho_schema.decode_jisho_response(raw)
+
+    assert decoded == jisho_schema.JishoResponse(
+        meta={"status": 200},
+        data=[
+            jisho_schema.JishoEntry(
+                japanese=[jisho_schema.JishoForm(word="猫", reading="ねこ")],
+                senses=[jisho_schema.JishoSense(english_definitions=["cat"])],
+            )
+        ],
+    )
+    assert jisho_schema.decode_jisho_response(b'{"data": "oops"}') is None
+
+
+def test_jisho_response_from_json_drops_malformed_parts() -> None:
+    payload = {
+        "data": [
+            "oops",
+            {
+                "japanese": [None, {"reading": "ねこ"}],
+                "senses": [{"english_definitions": ["cat", 3]}, "oops"],
+            },
+        ]
+    }
+
+    assert jisho_schema.jisho_response_from_json(payload) == jisho_schema.JishoResponse(
+        data=[
+            jisho_schema.JishoEntry(
+                japanese=[jisho_schema.JishoForm(reading="ねこ")],
+                senses=[jisho_schema.JishoSense(english_definitions=["cat"])],
+            )
+        ]
+    )
+    assert jisho_schema.jisho_response_from_json(["oops"]) == jisho_schema.JishoResponse()
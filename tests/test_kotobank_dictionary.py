@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
+import kotobank_dictionary
 from kotobank_dictionary import extract_first_kotobank_definition
 
 
@@ -52,6 +54,62 @@ class KotobankDictionaryExtractionTests(unittest.TestCase):
         definition = extract_first_kotobank_definition(html)
         self.assertEqual(definition, "本来の定義を返してほしい。")
 
+    def test_regex_fallback_without_html_parser(self) -> None:
+        html = """
+        <!-- <div class="description">コメント内の文</div> -->
+        <li class="meaning">正規表現でも取り出せる。</li>
+        """
+        with mock.patch.object(kotobank_dictionary, "LexborHTMLParser", None):
+            definition = extract_first_kotobank_definition(html)
+        self.assertEqual(definition, "正規表現でも取り出せる。")
+
+    @unittest.skipIf(
+        kotobank_dictionary.LexborHTMLParser is None, "selectolax is not installed"
+    )
+    def test_parser_ignores_commented_out_blocks(self) -> None:
+        html = """
+        <!-- <div class="description">コメント内の文</div> -->
+        <li class="meaning">パーサーでも取り出せる。</li>
+        <meta name="description" content="メタ説明">
+        """
+        definition = extract_first_kotobank_definition(html)
+        self.assertEqual(definition, "パーサーでも取り出せる。")
+
+    def test_nested_block_stops_at_first_closing_tag_on_both_paths(self) -> None:
+        html = (
+            '<section class="description"><h3>見出し</h3><p>定義文です。</p>'
+            '<div class="ads">広告</div></section>'
+        )
+        with mock.patch.object(kotobank_dictionary, "LexborHTMLParser", None):
+            self.assertEqual(extract_first_kotobank_definition(html), "見出し定義文です。")
+        if kotobank_dictionary.LexborHTMLParser is None:
+            self.skipTest("selectolax is not installed")
+        self.assertEqual(extract_first_kotobank_definition(html), "見出し定義文です。")
+
+    def test_skips_json_ld_blocks_without_descriptions(self) -> None:
+        html = """
+        <script type="application/ld+json">{"@type": "BreadcrumbList", "itemListElement": []}</script>
+        <script type="application/ld+json">{"@type": "DefinedTerm", "description": "本当の定義。"}</script>
+        """
+        with mock.patch.object(
+            kotobank_dictionary, "_json_loads", wraps=kotobank_dictionary._json_loads
+        ) as loads:
+            definition = extract_first_kotobank_definition(html)
+
+        self.assertEqual(definition, "本当の定義。")
+        self.assertEqual(loads.call_count, 1)
+
+    def test_json_ld_descriptions_keep_document_order_when_deeply_nested(self) -> None:
+        nested: object = {"@type": "Sense", "description": "深い定義"}
+        for _ in range(5000):
+            nested = {"@graph": [nested]}
+        data = {"description": "外側", "child": nested}
+
+        self.assertEqual(
+            list(kotobank_dictionary._iter_json_descriptions(data)),
+            [("外側", 1), ("深い定義", 0)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,8 @@
+import re
 from datetime import datetime
 
+import anki_deck_builder as builder
+
 from anki_deck_builder import (
     BuildParams,
     BuildResult,
@@ -21,6 +24,34 @@ def test_rich_build_reporter_collects_warnings_and_errors():
     assert reporter.errors == ["critical error"]
 
 
+def test_rich_build_reporter_batches_progress_advances():
+    reporter = RichBuildReporter(Console(record=True))
+    reporter.progress_start(1000, "Fetching")
+    progress = reporter._progress
+    task = progress.tasks[0]
+
+    for _ in range(4):
+        reporter.progress_advance()
+    assert task.completed == 0
+    reporter.progress_advance()
+    assert task.completed == 5
+
+    reporter.progress_advance(2)
+    reporter.progress_finish()
+    assert task.completed == 7
+
+
+def test_rich_build_reporter_streams_debug_to_log_file(tmp_path):
+    console = Console(record=True)
+    log_path = tmp_path / "out" / builder.DEBUG_LOG_FILE
+    with builder.debug_log_file(log_path) as debug_log:
+        reporter = RichBuildReporter(console, debug_log=debug_log)
+        reporter.debug("Parsed Jisho for '猫'")
+
+    assert "Parsed Jisho for '猫'" in log_path.read_text(encoding="utf-8")
+    assert "Parsed Jisho" not in console.export_text()
+
+
 def test_write_run_log_adds_summary_and_errors(tmp_path):
     csv_path = tmp_path / "terms.csv"
     csv_path.write_text("hello", encoding="utf-8")
@@ -64,3 +95,17 @@ def test_write_run_log_adds_summary_and_errors(tmp_path):
     assert "ERROR: missing media file" in log_text
     assert "WARNING: warned about something" in log_text
     assert "console line" in log_text
+
+
+def test_debug_print_snippet_matches_full_normalization():
+    page = "<html>\n\n" + ("  <p>本文\t\n text </p>\n" * 5000) + "</html>"
+    messages = []
+    builder._debug_print("Kotobank", "猫", page, logger=messages.append)
+
+    normalized = re.sub(r"\s+", " ", page).strip()
+    expected = normalized[:599].rstrip() + "…"
+    assert messages == [f"DEBUG Kotobank response for '猫': {expected}"]
+
+    sparse = "a" + " " * 10000 + "b"
+    builder._debug_print("Kotobank", "猫", sparse, logger=messages.append)
+    assert messages[-1].endswith(": a b")
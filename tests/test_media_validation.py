@@ -15,11 +15,12 @@ class CollectingReporter(builder.NullBuildReporter):
         self.warnings.append(message)
 
 
-def test_run_builder_filters_missing_media(
+def test_run_builder_filters_missing_and_shared_media(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     csv_path = tmp_path / "vocab.csv"
-    csv_path.write_text("こんにちは\n", encoding="utf-8")
+    # Both cards point at the same media files, as terms sharing a sentence do.
+    csv_path.write_text("こんにちは\nこんばんは\n", encoding="utf-8")
 
     media_dir = tmp_path / "out" / builder.MEDIA_DIR_NAME
 
@@ -60,5 +61,39 @@ def test_run_builder_filters_missing_media(
     expected_media = str(media_dir / "existing.mp3")
     assert result.media_files == [expected_media]
     assert captured_media == [expected_media]
-    assert any("missing.jpg" in warning for warning in reporter.warnings)
-
+    assert sum("missing.jpg" in warning for warning in reporter.warnings) == 1
+
+
+@pytest.mark.parametrize(
+    "base",
+    [
+        "cat_img",
+        "Cat_audio",
+        "deck2024",
+        "猫_img",
+        "猫_1a2b3c4d_sentence_audio",
+        "My Deck",
+        "a__b",
+        "_x",
+        "x-y",
+        "ｎｅｋｏ",
+    ],
+)
+def test_safe_filename_matches_slugify(base: str) -> None:
+    expected = builder.slugify(base, lowercase=False, separator="_") or builder.hashlib.md5(
+        base.encode("utf-8")
+    ).hexdigest()[:10]
+    assert builder.safe_filename(base) == expected
+
+
+def test_safe_filename_hash_fallback_is_stable_across_releases() -> None:
+    # Names with no slug (e.g. emoji) must keep matching media from earlier runs.
+    assert builder.safe_filename("🐱") == "3213e1bb82"
+
+
+def test_deterministic_guid_is_stable_across_releases() -> None:
+    # Existing decks rely on these exact values to update notes on re-import.
+    assert builder.deterministic_guid("猫", "ねこ", "cat") == int(
+        builder.hashlib.md5("猫::ねこ::cat".encode("utf-8")).hexdigest()[:8], 16
+    )
+    assert builder.deterministic_guid("a") == 0x0CC175B9
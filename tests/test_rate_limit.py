@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from rate_limit import HostConcurrencyLimiter, HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(2.0, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    clock.now += 10
+    bucket.acquire()
+    bucket.acquire()
+    assert len(clock.sleeps) == 1
+
+
+def test_host_rate_limiter_keeps_hosts_independent() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(
+        {"kotobank.jp": 1.0}, default_rate=5.0, clock=clock, sleep=clock.sleep
+    )
+
+    limiter.acquire("https://kotobank.jp/word/猫")
+    limiter.acquire("https://jisho.org/api/v1/search/words")
+    assert clock.sleeps == []
+
+    limiter.acquire("https://kotobank.jp/word/犬")
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert limiter.bucket_for("jisho.org").rate == 5.0
+
+
+def test_token_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_host_concurrency_limiter_caps_in_flight_requests() -> None:
+    limiter = HostConcurrencyLimiter({"tatoeba.org": 2}, default_limit=8)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def request(_: int) -> None:
+        nonlocal active, peak
+        with limiter.slot("https://tatoeba.org/en/api_v0/search"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(request, range(12)))
+
+    assert peak == 2
+    assert limiter.semaphore_for("jisho.org") is limiter.semaphore_for("jisho.org")
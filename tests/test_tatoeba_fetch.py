@@ -156,12 +156,12 @@ def test_fetch_tatoeba_prefers_native_and_longest(monkeypatch):
         {"results": []},
     ]
 
-    mock_requests = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
-    monkeypatch.setattr(anki_deck_builder, "requests", mock_requests)
+    mock_session = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
+    monkeypatch.setattr(anki_deck_builder, "_get_session", lambda: mock_session)
 
     jp, en = fetch_tatoeba_example("猫")
     assert (jp, en) == ("これは 長い 文", "long")
-    assert len(calls) == 3
+    assert len(calls) == 2  # the unfiltered search is skipped once native sentences exist
     assert calls[0].get("native") == "yes"
 
 
@@ -192,8 +192,8 @@ def test_fetch_tatoeba_falls_back_without_native(monkeypatch):
         {"results": []},
     ]
 
-    mock_requests = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
-    monkeypatch.setattr(anki_deck_builder, "requests", mock_requests)
+    mock_session = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
+    monkeypatch.setattr(anki_deck_builder, "_get_session", lambda: mock_session)
 
     jp, en = fetch_tatoeba_example("犬")
     assert (jp, en) == ("これは 長い サンプル", "long example")
@@ -223,12 +223,12 @@ def test_fetch_tatoeba_handles_translation_dict(monkeypatch):
         {"results": []},
     ]
 
-    mock_requests = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
-    monkeypatch.setattr(anki_deck_builder, "requests", mock_requests)
+    mock_session = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
+    monkeypatch.setattr(anki_deck_builder, "_get_session", lambda: mock_session)
 
     jp, en = fetch_tatoeba_example("辞書")
     assert (jp, en) == ("辞書", "dictionary")
-    assert len(calls) == 3
+    assert len(calls) == 2
     assert calls[0].get("native") == "yes"
 
 
@@ -268,8 +268,8 @@ def test_fetch_tatoeba_filters_by_token_match(monkeypatch):
     monkeypatch.setattr(
         anki_deck_builder, "_get_japanese_tokenizer", lambda: DummyTokenizer()
     )
-    mock_requests = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
-    monkeypatch.setattr(anki_deck_builder, "requests", mock_requests)
+    mock_session = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
+    monkeypatch.setattr(anki_deck_builder, "_get_session", lambda: mock_session)
 
     jp, en = fetch_tatoeba_example("いく")
     assert (jp, en) == ("明日いくよ", "I will go tomorrow")
@@ -308,8 +308,8 @@ def test_fetch_tatoeba_paginated_token_match(monkeypatch):
     monkeypatch.setattr(
         anki_deck_builder, "_get_japanese_tokenizer", lambda: DummyTokenizer()
     )
-    mock_requests = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
-    monkeypatch.setattr(anki_deck_builder, "requests", mock_requests)
+    mock_session = types.SimpleNamespace(get=_mocked_get_factory(responses, calls))
+    monkeypatch.setattr(anki_deck_builder, "_get_session", lambda: mock_session)
 
     jp, en = fetch_tatoeba_example("いく")
 
@@ -317,3 +317,22 @@ def test_fetch_tatoeba_paginated_token_match(monkeypatch):
     assert len(calls) == 3
     assert [call.get("page") for call in calls] == [1, 2, 3]
     assert all(call.get("native") == "yes" for call in calls)
+
+
+def test_select_tatoeba_candidate_priorities():
+    def cand(jp, length, **flags):
+        return {"jp": jp, "en": jp.upper(), "length": length, "contains_term": False, **flags}
+
+    select = anki_deck_builder._select_tatoeba_candidate
+
+    pool = [
+        cand("long", 30),
+        cand("short", 12),
+        cand("shorter", 8),
+        cand("contains-a", 18, contains_term=True),
+        cand("contains-b", 9, contains_term=True),
+    ]
+    assert select(pool)["jp"] == "contains-b"
+    assert select(pool + [cand("valid", 10, token_match=True)])["jp"] == "valid"
+    assert select([cand("long", 30), cand("short-a", 12), cand("short-b", 12)])["jp"] == "short-a"
+    assert select([cand("long", 30), cand("longer", 40)])["jp"] == "longer"
@@ -0,0 +1,202 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import anki_deck_builder as builder
+
+
+def test_gather_for_terms_preserves_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    delays = {"一": 0.05, "二": 0.0, "三": 0.02}
+    seen_threads: set[int] = set()
+
+    def _fake_gather_for_term(term: str, media_dir: Path, **_: object) -> builder.CardData:
+        time.sleep(delays[term])
+        seen_threads.add(threading.get_ident())
+        return builder.CardData(term=term)
+
+    monkeypatch.setattr(builder, "gather_for_term", _fake_gather_for_term)
+
+    completed: list[int] = []
+    cards = builder.gather_for_terms(
+        ["一", "二", "三"],
+        tmp_path,
+        max_workers=3,
+        on_complete=lambda: completed.append(1),
+    )
+
+    assert [card.term for card in cards] == ["一", "二", "三"]
+    assert len(completed) == 3
+    assert threading.get_ident() not in seen_threads
+
+
+def test_gather_for_terms_isolates_failing_terms(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fake_gather_for_term(term: str, media_dir: Path, **_: object) -> builder.CardData:
+        if term == "二":
+            raise RuntimeError("boom")
+        return builder.CardData(term=term, english=f"{term}!")
+
+    monkeypatch.setattr(builder, "gather_for_term", _fake_gather_for_term)
+
+    cards = builder.gather_for_terms(["一", "二", "三"], tmp_path, max_workers=2)
+
+    assert [(card.term, card.english) for card in cards] == [
+        ("一", "一!"),
+        ("二", ""),
+        ("三", "三!"),
+    ]
+
+
+def test_run_builder_fetches_duplicate_terms_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "vocab.csv"
+    csv_path.write_text("猫\n犬\n猫\n", encoding="utf-8")
+
+    fetched: list[str] = []
+
+    def _fake_gather_for_term(term: str, media_dir: Path, **_: object) -> builder.CardData:
+        fetched.append(term)
+        return builder.CardData(term=term)
+
+    monkeypatch.setattr(builder, "gather_for_term", _fake_gather_for_term)
+    monkeypatch.setattr(
+        builder.genanki.Package, "write_to_file", lambda self, path: Path(path).write_bytes(b"")
+    )
+
+    params = builder.BuildParams(
+        csv_path=csv_path,
+        output_dir=tmp_path / "out",
+        new_deck=True,
+        deck_name="Dedup Deck",
+    )
+    result = builder.run_builder(params)
+
+    assert sorted(fetched) == ["犬", "猫"]
+    assert result.total_terms == 3
+    assert result.notes_added == 2
+
+
+def test_sentence_audio_is_synthesized_once_per_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    class _FakeTTS:
+        def __init__(self, text: str, lang: str) -> None:
+            self.text = text
+
+        def save(self, path: str) -> None:
+            with lock:
+                calls.append(self.text)
+            time.sleep(0.02)
+            Path(path).write_bytes(b"mp3")
+
+    monkeypatch.setattr(builder, "gTTS", _FakeTTS)
+
+    with builder.shared_media_jobs():
+        threads = [
+            threading.Thread(
+                target=builder.generate_sentence_audio, args=("同じ文です。", tmp_path)
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["同じ文です。"]
+        filename = builder.generate_sentence_audio("同じ文です。", tmp_path)
+        assert (tmp_path / filename).exists()
+        assert calls == ["同じ文です。"]
+
+        (tmp_path / filename).unlink()
+        assert builder.generate_sentence_audio("同じ文です。", tmp_path) == filename
+        assert len(calls) == 2
+
+    assert builder._media_jobs is None
+
+
+def test_audio_generation_reuses_files_from_previous_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("gTTS should not be called for existing audio")
+
+    monkeypatch.setattr(builder, "gTTS", _fail)
+
+    term_file = builder.safe_filename("猫_audio") + ".mp3"
+    (tmp_path / term_file).write_bytes(b"mp3")
+    assert builder.generate_term_audio("猫", "ねこ", tmp_path) == term_file
+
+    # Sentence clips keep the name earlier releases gave them.
+    sentence_file = builder.safe_filename("猫が好きです。_2b330886_sentence_audio") + ".mp3"
+    (tmp_path / sentence_file).write_bytes(b"mp3")
+    assert builder.generate_sentence_audio("猫が好きです。", tmp_path) == sentence_file
+
+    (tmp_path / "empty.mp3").write_bytes(b"")
+    assert not builder._media_file_exists(tmp_path / "empty.mp3")
+
+
+def test_gather_for_term_overlaps_audio_with_image_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio_started = threading.Event()
+
+    monkeypatch.setattr(builder, "fetch_jisho_entry", lambda term, **_: ("ねこ", "cat", 1))
+    monkeypatch.setattr(builder, "fetch_tatoeba_example", lambda term, **_: ("猫だ。", "A cat."))
+    monkeypatch.setattr(builder, "fetch_wikipedia_ja_definition", lambda term, **_: "定義")
+
+    def _fake_term_audio(term: str, reading: str, media_dir: Path) -> str:
+        audio_started.set()
+        return "term.mp3"
+
+    def _fake_image(candidate: str, media_dir: Path) -> str:
+        # Only returns an image if synthesis is already running alongside.
+        return "cat.png" if audio_started.wait(timeout=2) else ""
+
+    monkeypatch.setattr(builder, "generate_term_audio", _fake_term_audio)
+    monkeypatch.setattr(builder, "generate_sentence_audio", lambda text, media_dir: "ex.mp3")
+    monkeypatch.setattr(builder, "fetch_duckduckgo_image", _fake_image)
+
+    with builder.ThreadPoolExecutor(max_workers=2) as side_executor:
+        card = builder.gather_for_term("猫", tmp_path, side_executor=side_executor)
+
+    assert card.image_filename == "cat.png"
+    assert card.audio_filename == "term.mp3"
+    assert card.sentence_audio_filename == "ex.mp3"
+
+
+def test_gather_for_term_fetches_jisho_and_tatoeba_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tatoeba_started = threading.Event()
+
+    def _fake_jisho(term: str, **_: object) -> tuple:
+        # Only resolves if Tatoeba was already dispatched alongside.
+        return ("ねこ", "cat", 1) if tatoeba_started.wait(timeout=2) else ("", "", 0)
+
+    def _fake_tatoeba(term: str, **_: object) -> tuple:
+        tatoeba_started.set()
+        return ("猫だ。", "A cat.")
+
+    monkeypatch.setattr(builder, "fetch_jisho_entry", _fake_jisho)
+    monkeypatch.setattr(builder, "fetch_tatoeba_example", _fake_tatoeba)
+    monkeypatch.setattr(builder, "fetch_duckduckgo_image", lambda candidate, media_dir: "")
+    monkeypatch.setattr(builder, "generate_term_audio", lambda *args: "")
+    monkeypatch.setattr(builder, "generate_sentence_audio", lambda *args: "")
+
+    with builder.ThreadPoolExecutor(max_workers=2) as side_executor:
+        card = builder.gather_for_term(
+            "猫", tmp_path, wikipedia_definition="定義", side_executor=side_executor
+        )
+
+    assert (card.reading, card.english) == ("ねこ", "cat")
+    assert (card.sentence_jp, card.sentence_en) == ("猫だ。", "A cat.")
@@ -4,16 +4,19 @@ import re
 
 WIKIPEDIA_MAX_CHARS = 260
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[。！？])\s*")
+
 
 def clean_wikipedia_extract(extract: str, *, max_chars: int = WIKIPEDIA_MAX_CHARS) -> str:
     text = extract.strip()
     if not text:
         return ""
 
-    normalized = re.sub(r"\s+", " ", text)
+    normalized = _WHITESPACE_RE.sub(" ", text)
     sentences = [
         s.strip()
-        for s in re.split(r"(?<=[。！？])\s*", normalized)
+        for s in _SENTENCE_SPLIT_RE.split(normalized)
         if s.strip()
     ]
 
@@ -37,6 +37,7 @@ WIKTIONARY_PART_OF_SPEECH_MARKERS: Final = {
 _SECTION_RE = re.compile(r"^=+\s*日本語\s*=+$")
 _NUMBER_PREFIX_RE = re.compile(r"^(?:\d+|[①-⑳]|[０-９]+)[.．、)）]?\s*")
 _BULLET_PREFIX_RE = re.compile(r"^[#・◆▶▷►＊※●○]\s*")
+_SENTENCE_END_RE = re.compile(r"(?<=。)")
 
 
 def _clean_line(line: str) -> str:
@@ -80,5 +81,5 @@ def extract_first_japanese_definition(extract: str) -> str:
         if cleaned:
             return cleaned
 
-    sentences = re.split(r"(?<=。)", extract)
+    sentences = _SENTENCE_END_RE.split(extract)
     return sentences[0].strip() if sentences else extract.strip()